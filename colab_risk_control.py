@@ -1,10 +1,58 @@
 # Colab Risk Control Interface
 # Copy this into a Colab cell to control stop loss and take profit levels
+# Call init() after loading to print the current settings
 
-import sys
-sys.path.append('cryptobot')
+import os
+import time
 
-from utils.risk_manager import DynamicRiskManager
+from cryptobot.config import BotConfig, STRAT_ULTRA, STRAT_FAST, STRAT_QM, STRAT_TTM
+from cryptobot.utils.risk_manager import DynamicRiskManager
+
+# Short-lived snapshot of DynamicRiskManager settings so repeated reads
+# from notebook cells don't go back to the risk manager every time
+_SETTINGS_CACHE = {"data": None, "ts": 0}
+_CACHE_TTL = 2.0
+
+# Per-strategy block of the get_current_risk_settings() report
+_STRATEGY_TEMPLATE = "   {name}:\n      Stop Loss: {sl}%\n      Take Profit: {tp}%".format_map
+
+# Usage text printed by show_examples()
+_EXAMPLES_TEXT = """
+🎯 RISK CONTROL EXAMPLES:
+
+# 1. Check current settings
+get_current_risk_settings()
+
+# 2. Make all strategies conservative (tighter stops)
+make_conservative()
+
+# 3. Make all strategies aggressive (wider stops)
+make_aggressive()
+
+# 4. Reset to default settings
+reset_to_default()
+
+# 5. Apply a preset by name
+apply_preset("conservative")
+
+# 6. Update global settings only
+update_global_risk(stop_loss_percent=0.4, take_profit_percent=0.8)
+
+# 7. Update specific strategy
+update_strategy_risk("Ultra-Scalp", stop_loss_percent=0.20, take_profit_percent=0.40)
+
+# 8. Quick adjustments
+update_global_risk(stop_loss_percent=0.3)  # Just change stop loss
+update_global_risk(take_profit_percent=1.5)  # Just change take profit
+    """
+
+def _invalidate_settings_cache():
+    """Drop the cached settings snapshot after any update"""
+    _SETTINGS_CACHE["data"] = None
+
+def _as_percent(value):
+    """Coerce a user-supplied percentage to float, leaving None untouched"""
+    return float(value) if value is not None else None
 
 def update_global_risk(stop_loss_percent=None, take_profit_percent=None):
     """
@@ -20,10 +68,14 @@ def update_global_risk(stop_loss_percent=None, take_profit_percent=None):
     # Check current settings
     get_current_risk_settings()
     """
+    if stop_loss_percent is None and take_profit_percent is None:
+        return
+    
     DynamicRiskManager.update_global_risk_settings(
-        stop_loss_percent=stop_loss_percent,
-        take_profit_percent=take_profit_percent
+        stop_loss_percent=_as_percent(stop_loss_percent),
+        take_profit_percent=_as_percent(take_profit_percent)
     )
+    _invalidate_settings_cache()
 
 def update_strategy_risk(strategy_name, stop_loss_percent=None, take_profit_percent=None):
     """
@@ -36,103 +88,105 @@ def update_strategy_risk(strategy_name, stop_loss_percent=None, take_profit_perc
     # Make TTM-Squeeze more aggressive
     update_strategy_risk("TTM-Squeeze", stop_loss_percent=1.0, take_profit_percent=2.0)
     """
+    if stop_loss_percent is None and take_profit_percent is None:
+        return
+    
     DynamicRiskManager.update_strategy_risk_settings(
         strategy_name=strategy_name,
-        stop_loss_percent=stop_loss_percent,
-        take_profit_percent=take_profit_percent
+        stop_loss_percent=_as_percent(stop_loss_percent),
+        take_profit_percent=_as_percent(take_profit_percent)
     )
+    _invalidate_settings_cache()
+
+def _apply_bulk_update(payload):
+    """Submit a combined global + per-strategy update in a single call"""
+    DynamicRiskManager.bulk_update_settings(payload)
+    _invalidate_settings_cache()
+
+def _get_cached_risk_settings():
+    """Return the settings snapshot, refreshing it once the TTL has expired"""
+    now = time.monotonic()
+    if _SETTINGS_CACHE["data"] is None or now - _SETTINGS_CACHE["ts"] >= _CACHE_TTL:
+        _SETTINGS_CACHE["data"] = DynamicRiskManager.get_current_risk_settings()
+        _SETTINGS_CACHE["ts"] = now
+    return _SETTINGS_CACHE["data"]
 
 def get_current_risk_settings():
     """Get current risk settings for all strategies"""
-    settings = DynamicRiskManager.get_current_risk_settings()
-    
-    print("🛡️ Current Risk Settings:")
-    print(f"   Global Stop Loss: {settings['global_stop_loss']}%")
-    print(f"   Global Take Profit: {settings['global_take_profit']}%")
-    print("\n📊 Strategy-Specific Settings:")
-    
-    for strategy, risk in settings['strategies'].items():
-        print(f"   {strategy}:")
-        print(f"      Stop Loss: {risk['stop_loss']}%")
-        print(f"      Take Profit: {risk['take_profit']}%")
-    
+    settings = _get_cached_risk_settings()
+    
+    # Build the whole report first and write it with a single print
+    lines = [
+        "🛡️ Current Risk Settings:",
+        f"   Global Stop Loss: {settings['global_stop_loss']}%",
+        f"   Global Take Profit: {settings['global_take_profit']}%",
+        "\n📊 Strategy-Specific Settings:"
+    ]
+    lines.extend(
+        _STRATEGY_TEMPLATE({"name": strategy, "sl": risk['stop_loss'], "tp": risk['take_profit']})
+        for strategy, risk in settings['strategies'].items()
+    )
+    print("\n".join(lines))
+
     return settings
 
+# Preset risk levels: (global, Ultra-Scalp, Fast-Scalp, Quick-Momentum, TTM-Squeeze)
+# Each entry is a (stop_loss %, take_profit %) pair
+_PRESETS = {
+    "conservative": ((0.3, 0.6), (0.15, 0.30), (0.20, 0.40), (0.25, 0.50), (0.30, 0.60)),
+    "aggressive": ((1.0, 2.0), (0.50, 1.00), (0.60, 1.20), (0.80, 1.60), (1.00, 2.00)),
+    # Same values the risk manager starts with
+    "default": (
+        (BotConfig.DYNAMIC_STOP_LOSS_PERCENT, BotConfig.DYNAMIC_TAKE_PROFIT_PERCENT),
+        (BotConfig.DYNAMIC_ULTRA_SCALP_SL, BotConfig.DYNAMIC_ULTRA_SCALP_TP),
+        (BotConfig.DYNAMIC_FAST_SCALP_SL, BotConfig.DYNAMIC_FAST_SCALP_TP),
+        (BotConfig.DYNAMIC_QUICK_MOMENTUM_SL, BotConfig.DYNAMIC_QUICK_MOMENTUM_TP),
+        (BotConfig.DYNAMIC_TTM_SQUEEZE_SL, BotConfig.DYNAMIC_TTM_SQUEEZE_TP),
+    ),
+}
+_STRATS = (STRAT_ULTRA, STRAT_FAST, STRAT_QM, STRAT_TTM)
+
+def apply_preset(mode):
+    """Apply one of the preset risk levels ("conservative", "aggressive", "default")"""
+    (global_sl, global_tp), *per_strategy = _PRESETS[mode]
+    _apply_bulk_update({
+        "global": {"stop_loss": global_sl, "take_profit": global_tp},
+        "strategies": {
+            name: {"stop_loss": sl, "take_profit": tp}
+            for name, (sl, tp) in zip(_STRATS, per_strategy)
+        }
+    })
+
 def make_conservative():
     """Make all strategies more conservative (tighter stops)"""
     print("🛡️ Making all strategies more conservative...")
-    
-    # Update global settings
-    update_global_risk(stop_loss_percent=0.3, take_profit_percent=0.6)
-    
-    # Update individual strategies
-    update_strategy_risk("Ultra-Scalp", stop_loss_percent=0.15, take_profit_percent=0.30)
-    update_strategy_risk("Fast-Scalp", stop_loss_percent=0.20, take_profit_percent=0.40)
-    update_strategy_risk("Quick-Momentum", stop_loss_percent=0.25, take_profit_percent=0.50)
-    update_strategy_risk("TTM-Squeeze", stop_loss_percent=0.30, take_profit_percent=0.60)
-    
+    apply_preset("conservative")
     print("✅ All strategies set to conservative mode")
 
 def make_aggressive():
     """Make all strategies more aggressive (wider stops)"""
     print("🚀 Making all strategies more aggressive...")
-    
-    # Update global settings
-    update_global_risk(stop_loss_percent=1.0, take_profit_percent=2.0)
-    
-    # Update individual strategies
-    update_strategy_risk("Ultra-Scalp", stop_loss_percent=0.50, take_profit_percent=1.00)
-    update_strategy_risk("Fast-Scalp", stop_loss_percent=0.60, take_profit_percent=1.20)
-    update_strategy_risk("Quick-Momentum", stop_loss_percent=0.80, take_profit_percent=1.60)
-    update_strategy_risk("TTM-Squeeze", stop_loss_percent=1.00, take_profit_percent=2.00)
-    
+    apply_preset("aggressive")
     print("✅ All strategies set to aggressive mode")
 
 def reset_to_default():
     """Reset all risk settings to default values"""
     print("🔄 Resetting all risk settings to default...")
-    
-    # Reset global settings
-    update_global_risk(stop_loss_percent=0.5, take_profit_percent=1.0)
-    
-    # Reset individual strategies
-    update_strategy_risk("Ultra-Scalp", stop_loss_percent=0.25, take_profit_percent=0.50)
-    update_strategy_risk("Fast-Scalp", stop_loss_percent=0.30, take_profit_percent=0.60)
-    update_strategy_risk("Quick-Momentum", stop_loss_percent=0.40, take_profit_percent=0.80)
-    update_strategy_risk("TTM-Squeeze", stop_loss_percent=0.50, take_profit_percent=1.00)
-    
+    apply_preset("default")
     print("✅ All risk settings reset to default")
 
 def show_examples():
     """Show usage examples"""
-    print("""
-🎯 RISK CONTROL EXAMPLES:
-
-# 1. Check current settings
-get_current_risk_settings()
+    print(_EXAMPLES_TEXT)
 
-# 2. Make all strategies conservative (tighter stops)
-make_conservative()
-
-# 3. Make all strategies aggressive (wider stops)
-make_aggressive()
-
-# 4. Reset to default settings
-reset_to_default()
-
-# 5. Update global settings only
-update_global_risk(stop_loss_percent=0.4, take_profit_percent=0.8)
-
-# 6. Update specific strategy
-update_strategy_risk("Ultra-Scalp", stop_loss_percent=0.20, take_profit_percent=0.40)
-
-# 7. Quick adjustments
-update_global_risk(stop_loss_percent=0.3)  # Just change stop loss
-update_global_risk(take_profit_percent=1.5)  # Just change take profit
-    """)
+def init():
+    """Show that the interface is loaded along with the current settings"""
+    print("🛡️ Risk Control Interface Loaded!")
+    print("📊 Current risk settings:")
+    get_current_risk_settings()
+    print("\n💡 Use show_examples() to see all available commands")
 
-# Initialize and show current settings
-print("🛡️ Risk Control Interface Loaded!")
-print("📊 Current risk settings:")
-get_current_risk_settings()
-print("\n💡 Use show_examples() to see all available commands")
+# Importing no longer reads the risk settings; call init() from the notebook
+# (or set COLAB_RISK_AUTOSHOW=1) to print them on load
+if os.environ.get("COLAB_RISK_AUTOSHOW"):
+    init()
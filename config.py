@@ -9,12 +9,121 @@ Contains ALL parameters used by:
 - Exchange API connections
 """
 
-class BotConfig:
+import functools
+import json
+import os
+import re
+import sys
+from enum import IntEnum
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    import fastjsonschema
+except ImportError:  # Optional: fall back to the small validator below
+    fastjsonschema = None
+
+# ========== STRATEGY NAMES ==========
+# Interned once and shared by the config, risk manager and preset helpers
+STRAT_ULTRA = sys.intern("Ultra-Scalp")
+STRAT_FAST = sys.intern("Fast-Scalp")
+STRAT_QM = sys.intern("Quick-Momentum")
+STRAT_TTM = sys.intern("TTM-Squeeze")
+STRATEGY_NAMES = (STRAT_ULTRA, STRAT_FAST, STRAT_QM, STRAT_TTM)
+
+# Position of each strategy in STRATEGY_NAMES and in every per-strategy array
+class StratId(IntEnum):
+    ULTRA_SCALP = 0
+    FAST_SCALP = 1
+    QUICK_MOMENTUM = 2
+    TTM_SQUEEZE = 3
+
+# ========== RUN MODES ==========
+# BotConfig.MODE stays the human-readable string; BotConfig.MODE_ID is the
+# matching Mode value, used to index per-mode handler tables
+class Mode(IntEnum):
+    PAPER = 0
+    LIVE = 1
+    BACKTEST = 2
+
+# Derived values computed on first access instead of at import (name -> function)
+_LAZY_DERIVED = {}
+
+# Lazy settings given explicitly to load() (config.json, BOT_* env, override());
+# the others are re-read from their environment variable after every load
+_LOADED_LAZY_SETTINGS = set()
+
+# Old setting names kept as read-only aliases (alias -> source); loading an alias sets its source
+_ALIASES = {
+    "PAPER_INITIAL_BALANCE": "INITIAL_BALANCE",
+    "TTM_SQUEEZE_MAX_HOLD_SECONDS": "TTM_MAX_HOLD_SECONDS",
+}
+
+def _resolve_aliases(values):
+    """Rename alias keys to their source setting; both with different values is an error"""
+    resolved = dict(values)
+    for alias, source in _ALIASES.items():
+        if alias in resolved:
+            value = resolved.pop(alias)
+            if source in resolved and resolved[source] != value:
+                raise ValueError(f"{alias} is an alias of {source} and conflicts with it; set only {source}")
+            resolved[source] = value
+    return resolved
+
+def _env_setting(name, default):
+    """Read a lazy setting from the environment, falling back to its placeholder"""
+    return sys.intern(os.environ.get(name, default))
+
+class _FrozenConfigMeta(type):
+    """Metaclass that makes BotConfig read-only outside of override() / refresh()"""
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        # Settings declared in the class body (or inherited from a with_overrides() base);
+        # derived values added later are not overridable
+        inherited = frozenset().union(*(getattr(base, "__config_field_names__", ()) for base in bases))
+        type.__setattr__(cls, "__config_field_names__", frozenset(
+            key for key in vars(cls) if key.isupper()
+        ) | frozenset(namespace.get("__lazy_settings__", ())) | inherited)
+
+    def __getattr__(cls, name):
+        # Only reached when normal lookup fails: resolve lazy settings once, then cache
+        lazy_settings = getattr(cls, "__lazy_settings__", None)
+        if lazy_settings is not None and name in lazy_settings:
+            value = _env_setting(name, lazy_settings[name])
+        elif lazy_settings is not None and name in _LAZY_DERIVED:
+            value = _LAZY_DERIVED[name]()
+        else:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        type.__setattr__(cls, name, value)
+        return value
+
+    def __setattr__(cls, key, value):
+        raise AttributeError(
+            f"{cls.__name__}.{key} is read-only; use {cls.__name__}.override() or refresh() to change settings"
+        )
+
+    def __delattr__(cls, key):
+        raise AttributeError(f"{cls.__name__}.{key} cannot be deleted")
+
+def _require_live_config(cls):
+    """refresh() / load() / override() only change BotConfig; with_overrides() copies stay fixed"""
+    if cls is not BotConfig:
+        raise TypeError(
+            f"{cls.__name__} is a read-only with_overrides() copy; call with_overrides() again for other values"
+        )
+
+def _set_config(key, value):
+    """Internal write path used by refresh() and the derived-value builders"""
+    type.__setattr__(BotConfig, key, value)
+
+class BotConfig(metaclass=_FrozenConfigMeta):
     # ========== CORE TRADING PARAMETERS ==========
-    TRADING_SYMBOLS = ["BTC", "AVAX", "SOL"]
-    MODE = "paper"
+    TRADING_SYMBOLS = tuple(sys.intern(s) for s in ("BTC", "AVAX", "SOL"))  # See SYMBOL_INDEX
+    MODE = sys.intern("paper")
     INITIAL_BALANCE = 10000
-    PAPER_INITIAL_BALANCE = 10000
+    PAPER_INITIAL_BALANCE = INITIAL_BALANCE  # Alias for compatibility, see _ALIASES
     CYCLE_INTERVAL = 60
     MIN_CONFIDENCE = 0.25
     MIN_DATA_POINTS = 20
@@ -23,17 +132,15 @@ class BotConfig:
 
     # ==================== STRATEGY WEIGHTS (USED BY AGGREGATOR) ====================
     STRATEGY_WEIGHTS = {
-        "Ultra-Scalp": 0.8,  # Lower weight for highest frequency
-        "Fast-Scalp": 0.9,
-        "Quick-Momentum": 1.0,
-        "TTM-Squeeze": 1.1  # Higher weight for more reliable signals
+        STRAT_ULTRA: 0.8,  # Lower weight for highest frequency
+        STRAT_FAST: 0.9,
+        STRAT_QM: 1.0,
+        STRAT_TTM: 1.1  # Higher weight for more reliable signals
     }
     
     # ========== EXCHANGE API CONFIGURATION ==========
-    EXCHANGE_NAME = "coinbase"
-    COINBASE_API_KEY = "coinbase-api_key"
-    COINBASE_API_SECRET = "coinbase_api_secret"
-    PASSPHRASE = "YOUR_PASSPHRASE_HERE"
+    EXCHANGE_NAME = sys.intern("coinbase")
+    # COINBASE_API_KEY / COINBASE_API_SECRET / PASSPHRASE: see __lazy_settings__
  
     # ========== RISK MANAGEMENT ==========
     POSITION_SIZE_PERCENT = 25.0
@@ -119,7 +226,7 @@ class BotConfig:
     TTM_ADX_THRESHOLD = 22
     TTM_BB_WIDTH_PERCENTILE = 35
     TTM_MAX_HOLD_SECONDS = 8000
-    TTM_SQUEEZE_MAX_HOLD_SECONDS = 8000  # Alias for compatibility
+    TTM_SQUEEZE_MAX_HOLD_SECONDS = TTM_MAX_HOLD_SECONDS  # Alias for compatibility, see _ALIASES
     TTM_SQUEEZE_BASE_CONFIDENCE = 0.6
     TTM_SQUEEZE_SQUEEZE_BONUS = 0.2
     TTM_SQUEEZE_MOMENTUM_BONUS = 0.1
@@ -141,16 +248,13 @@ class BotConfig:
 
     # ========== TELEGRAM NOTIFICATIONS ==========
     TELEGRAM_ENABLED = True
-    TELEGRAM_BOT_TOKEN = "YOUR_BOT_TOKEN_HERE"
-    TELEGRAM_CHAT_ID = "YOUR_CHAT_ID_HERE"
+    # TELEGRAM_BOT_TOKEN / TELEGRAM_CHAT_ID: see __lazy_settings__
     NOTIFY_ALL_SIGNALS = True
     NOTIFY_TRADES = True
     NOTIFY_ERRORS = True
 
     # ========== HYPERLIQUID CONFIGURATION ==========
-    HYPERLIQUID_API_KEY = "your_api_key_here"  # Leave empty for read-only mode
-    HYPERLIQUID_API_SECRET = "your_api_secret_here"  # Leave empty for read-only mode
-    HYPERLIQUID_ACCOUNT_ADDRESS = "your_wallet_address_here"  # Optional but recommended
+    # HYPERLIQUID_API_KEY / _API_SECRET / _ACCOUNT_ADDRESS / _PRIVATE_KEY: see __lazy_settings__
     
     # Risk management defaults
     DYNAMIC_STOP_LOSS_PERCENT = 0.5  # Global default stop loss %
@@ -166,9 +270,457 @@ class BotConfig:
     DYNAMIC_TTM_SQUEEZE_SL = 0.5
     DYNAMIC_TTM_SQUEEZE_TP = 1.0
     
+    # Rapid risk updates from Colab are coalesced and applied together
+    RISK_WRITE_BATCH_TIMEOUT_MS = 100  # Quiet period before a pending batch is applied
+    RISK_WRITE_BATCH_MAX = 16  # Apply immediately once this many updates are pending
+    
     # Data collection settings
     DATA_COLLECTION_ENABLED = False  # Set to True if you want initial data collection
     INITIAL_DATA_COLLECTION_MINUTES = 15  # Only used if DATA_COLLECTION_ENABLED=True
     MIN_DATA_MINUTES = 20  # Minimum data required before trading
 
-__all__ = ['BotConfig']
+    # ========== CREDENTIALS ==========
+    # Read from the environment variable of the same name on first access (the
+    # trading loop never touches them); the value here is the fallback placeholder.
+    # Never commit real keys here
+    __lazy_settings__ = {
+        "COINBASE_API_KEY": "",
+        "COINBASE_API_SECRET": "",
+        "PASSPHRASE": "YOUR_PASSPHRASE_HERE",
+        "TELEGRAM_BOT_TOKEN": "YOUR_BOT_TOKEN_HERE",
+        "TELEGRAM_CHAT_ID": "YOUR_CHAT_ID_HERE",
+        "HYPERLIQUID_API_KEY": "your_api_key_here",  # Leave empty for read-only mode
+        "HYPERLIQUID_API_SECRET": "your_api_secret_here",  # Leave empty for read-only mode
+        "HYPERLIQUID_ACCOUNT_ADDRESS": "your_wallet_address_here",  # Optional but recommended
+        "HYPERLIQUID_PRIVATE_KEY": "",  # Env only, never commit a key; empty = read-only
+    }
+
+    @classmethod
+    def refresh(cls, path=None):
+        """
+        Re-read the JSON override file and apply it on top of the defaults above
+        Unknown keys are rejected so a typo can't silently create a new setting
+        """
+        _require_live_config(cls)
+        overrides = _read_overrides(path or CONFIG_JSON_PATH)
+        unknown = [key for key in overrides if key not in cls.__config_field_names__]
+        if unknown:
+            raise AttributeError(f"Unknown config keys in override file: {', '.join(unknown)}")
+        
+        # BOT_<NAME> environment variables win over the file; both go through one validation
+        overrides = _resolve_aliases(overrides)
+        overrides.update(_resolve_aliases(_read_env_overrides()))
+        return cls.load(overrides)
+
+    @classmethod
+    def load(cls, values):
+        """
+        Validate a mapping of settings against SCHEMA and apply it in one go
+        Nothing is assigned unless every value passes
+        """
+        _require_live_config(cls)
+        unknown = [key for key in values if key not in cls.__config_field_names__]
+        if unknown:
+            raise AttributeError(f"Unknown config keys: {', '.join(unknown)}")
+        values = _resolve_aliases(values)
+        _VALIDATE(values)
+        
+        for key, value in values.items():
+            _set_config(key, value)
+        _LOADED_LAZY_SETTINGS.update(values.keys() & cls.__lazy_settings__.keys())
+        _rebuild_derived()
+        return values
+
+    @classmethod
+    def override(cls, key, value):
+        """Change a single setting at runtime and rebuild the derived values"""
+        cls.load({key: value})
+
+    @classmethod
+    def with_overrides(cls, **values):
+        """
+        Validated read-only copy of the config with some settings changed, e.g. one
+        per parameter-sweep combination; the class it is called on is left untouched.
+        Per-class derived values (aliases, SL/TP multipliers, D) are recomputed for
+        the copy; module-level arrays such as RISK_PARAMS keep describing BotConfig
+        """
+        unknown = [key for key in values if key not in cls.__config_field_names__]
+        if unknown:
+            raise AttributeError(f"Unknown config keys: {', '.join(unknown)}")
+        values = _resolve_aliases(values)
+        _VALIDATE(values)
+        
+        namespace = {
+            key: sys.intern(value) if isinstance(value, str) else value
+            for key, value in values.items()
+        }
+        if "TRADING_SYMBOLS" in namespace:
+            namespace["TRADING_SYMBOLS"] = tuple(sys.intern(s) for s in namespace["TRADING_SYMBOLS"])
+        copy = _FrozenConfigMeta(cls.__name__, (cls,), namespace)
+        for key, value in _derived_class_values(copy).items():
+            type.__setattr__(copy, key, value)
+        return copy
+
+# ========== OPTIONAL JSON OVERRIDES ==========
+# config.json next to this file (or CRYPTOBOT_CONFIG) is read once at import;
+# call BotConfig.refresh() to pick up edits while the bot runs
+CONFIG_JSON_PATH = os.environ.get(
+    "CRYPTOBOT_CONFIG",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+)
+
+def _read_overrides(path):
+    """Load the override mapping from disk, or nothing if the file is missing"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+ENV_PREFIX = "BOT_"
+
+def _read_env_overrides(prefix=ENV_PREFIX):
+    """
+    Collect BOT_<NAME> environment variables for known settings
+    Strings are taken as-is; numbers, booleans, lists and dicts are parsed as JSON
+    """
+    overrides = {}
+    for env_key, raw in os.environ.items():
+        if not env_key.startswith(prefix):
+            continue
+        key = env_key[len(prefix):]
+        if key not in BotConfig.__config_field_names__:
+            continue
+        if BotConfig.SCHEMA["properties"][key].get("type") == "string":
+            overrides[key] = raw
+            continue
+        try:
+            overrides[key] = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{env_key} is not valid JSON: {e}") from None
+    return overrides
+
+# ========== SCHEMA ==========
+# JSON Schema for every BotConfig setting, compiled once into _VALIDATE.
+# Types come from the defaults; bounds are added for the values that matter
+# bool is checked before int/float because it subclasses int; ints and floats
+# both map to "number" so 10 and 10.0 are interchangeable in config.json
+_JSON_TYPES = ((bool, "boolean"), ((int, float), "number"), (str, "string"),
+               ((list, tuple), "array"), (dict, "object"))
+
+def _schema_type(value):
+    """JSON Schema type name for a default value"""
+    for py_type, json_type in _JSON_TYPES:
+        if isinstance(value, py_type):
+            return json_type
+    return None
+
+def _build_schema():
+    """Describe every setting's type plus ranges for modes, symbols and percentages"""
+    properties = {}
+    for key in sorted(BotConfig.__config_field_names__):
+        if key in BotConfig.__lazy_settings__:
+            # Don't resolve credentials just to describe them
+            properties[key] = {"type": "string"}
+            continue
+        json_type = _schema_type(getattr(BotConfig, key))
+        properties[key] = {"type": json_type} if json_type else {}
+        if json_type == "number" and (key.endswith(("_PERCENT", "_SECONDS", "_PERIOD"))
+                                      or "CONFIDENCE" in key or key.endswith(("_SL", "_TP"))):
+            properties[key]["minimum"] = 0
+        if "CONFIDENCE" in key and json_type == "number":
+            properties[key]["maximum"] = 1
+    
+    properties["MODE"] = {"type": "string", "enum": [mode.name.lower() for mode in Mode]}
+    properties["TRADING_SYMBOLS"] = {
+        "type": "array",
+        "items": {"type": "string", "pattern": "^[A-Z0-9]+$"},
+        "minItems": 1
+    }
+    properties["STRATEGY_WEIGHTS"] = {
+        "type": "object",
+        "additionalProperties": {"type": "number", "minimum": 0}
+    }
+    # Check order = property order: likeliest failures first so bad overrides bail early
+    ordered = dict(sorted(properties.items(), key=lambda item: _failure_rank(*item)))
+    return {"type": "object", "properties": ordered, "additionalProperties": False}
+
+def _failure_rank(key, schema):
+    """Rough order of how often a setting is wrong in an override: mode, lists, bounded numbers, rest"""
+    if key == "MODE":
+        return 0
+    if schema.get("type") in ("array", "object"):
+        return 1
+    if "minimum" in schema or "maximum" in schema:
+        return 2
+    return 3
+
+def _check(schema, value, path):
+    """Minimal validator for the subset of JSON Schema used by _build_schema()"""
+    json_type = schema.get("type")
+    if json_type and _schema_type(value) != json_type:
+        raise ValueError(f"{path} must be of type {json_type}")
+    if "enum" in schema and value not in schema["enum"]:
+        raise ValueError(f"{path} must be one of {schema['enum']}")
+    if "minimum" in schema and value < schema["minimum"]:
+        raise ValueError(f"{path} must be >= {schema['minimum']}")
+    if "maximum" in schema and value > schema["maximum"]:
+        raise ValueError(f"{path} must be <= {schema['maximum']}")
+    if "pattern" in schema and not re.search(schema["pattern"], value):
+        raise ValueError(f"{path} must match {schema['pattern']}")
+    if json_type == "array":
+        if len(value) < schema.get("minItems", 0):
+            raise ValueError(f"{path} must have at least {schema['minItems']} items")
+        for i, item in enumerate(value):
+            _check(schema.get("items", {}), item, f"{path}[{i}]")
+    if json_type == "object":
+        properties = schema.get("properties", {})
+        extra = schema.get("additionalProperties", True)
+        # Unknown keys first, then known ones in the schema's (failure-ranked) order
+        for key, item in value.items():
+            if key in properties:
+                continue
+            if extra is False:
+                raise ValueError(f"{path}.{key} is not a known setting")
+            if isinstance(extra, dict):
+                _check(extra, item, f"{path}.{key}")
+        for key, sub_schema in properties.items():
+            if key in value:
+                _check(sub_schema, value[key], f"{path}.{key}")
+
+def _compile_validator(schema):
+    """Compile with fastjsonschema when installed, otherwise use _check()"""
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
+    
+    def validate(data):
+        _check(schema, data, "config")
+        return data
+    return validate
+
+_set_config("SCHEMA", _build_schema())
+_VALIDATE = _compile_validator(BotConfig.SCHEMA)
+
+# ========== PER-STRATEGY RISK ARRAY ==========
+# One row per strategy (same order as STRATEGY_NAMES) so strategy code can work
+# on all strategies at once. float32 is approximate; BotConfig stays the exact source.
+RISK_FIELDS = ("stop_loss", "take_profit", "max_hold", "base_confidence")
+
+def _build_risk_params():
+    """Pack the current BotConfig risk values into a read-only float32 array"""
+    params = np.array([
+        # sl, tp, max_hold, base_conf
+        [BotConfig.ULTRA_SCALP_STOP_LOSS_PERCENT, BotConfig.ULTRA_SCALP_TAKE_PROFIT_PERCENT,
+         BotConfig.ULTRA_SCALP_MAX_HOLD_SECONDS, BotConfig.ULTRA_SCALP_BASE_CONFIDENCE],
+        [BotConfig.FAST_SCALP_STOP_LOSS_PERCENT, BotConfig.FAST_SCALP_TAKE_PROFIT_PERCENT,
+         BotConfig.FAST_SCALP_MAX_HOLD_SECONDS, BotConfig.FAST_SCALP_BASE_CONFIDENCE],
+        [BotConfig.QUICK_MOMENTUM_STOP_LOSS, BotConfig.QUICK_MOMENTUM_PROFIT_TARGET,
+         BotConfig.QUICK_MOMENTUM_MAX_HOLD_SECONDS, BotConfig.QUICK_MOMENTUM_BASE_CONFIDENCE],
+        [BotConfig.TTM_STOP_LOSS_PERCENT, BotConfig.TTM_TAKE_PROFIT_PERCENT,
+         BotConfig.TTM_MAX_HOLD_SECONDS, BotConfig.TTM_SQUEEZE_BASE_CONFIDENCE],
+    ], dtype=np.float32)
+    params.flags.writeable = False
+    return params
+
+# Same values as a packed record per strategy (16 bytes each) for risk sweeps
+# over open positions, e.g. RISK_TABLE["max_hold"][strategy_ids]
+RISK_DTYPE = np.dtype([
+    ("sl", np.float32),
+    ("tp", np.float32),
+    ("max_hold", np.int32),
+    ("base_conf", np.float32),
+])
+
+def _build_risk_table():
+    """Build the read-only RISK_TABLE record array from RISK_PARAMS rows"""
+    table = np.array([tuple(row) for row in _build_risk_params().tolist()], dtype=RISK_DTYPE)
+    table.flags.writeable = False
+    return table
+
+STRAT_IDX = {name: StratId(i) for i, name in enumerate(STRATEGY_NAMES)}
+
+# Per-parameter arrays across strategies (STRATEGY_NAMES order), so all four
+# can be tested at once, e.g. buy_mask = rsi_row < STRAT_RSI_BUY.
+# Quick-Momentum has no RSI rule: period 0 and NaN thresholds never match
+def _build_strategy_arrays():
+    """Build the read-only per-parameter strategy arrays"""
+    arrays = {
+        "STRAT_RSI_PERIODS": np.array([
+            BotConfig.ULTRA_SCALP_RSI_PERIOD, BotConfig.FAST_SCALP_RSI_PERIOD,
+            0, BotConfig.TTM_SQUEEZE_RSI_PERIOD
+        ], dtype=np.int32),
+        "STRAT_RSI_BUY": np.array([
+            BotConfig.ULTRA_SCALP_RSI_BUY_THRESHOLD, BotConfig.FAST_SCALP_RSI_OVERSOLD,
+            np.nan, BotConfig.TTM_SQUEEZE_RSI_BUY_THRESHOLD
+        ], dtype=np.float32),
+        "STRAT_RSI_SELL": np.array([
+            BotConfig.ULTRA_SCALP_RSI_SELL_THRESHOLD, BotConfig.FAST_SCALP_RSI_OVERBOUGHT,
+            np.nan, BotConfig.TTM_SQUEEZE_RSI_SELL_THRESHOLD
+        ], dtype=np.float32),
+        # STRATEGY_WEIGHTS by StratId; float64 so weighted confidences match the dict lookup
+        "WEIGHTS": np.array([
+            BotConfig.STRATEGY_WEIGHTS.get(name, 1.0) for name in STRATEGY_NAMES
+        ], dtype=np.float64),
+        # Columns of RISK_PARAMS, no copy
+        "STRAT_STOP": RISK_PARAMS[:, 0],
+        "STRAT_TARGET": RISK_PARAMS[:, 1],
+        "STRAT_MAX_HOLD": RISK_PARAMS[:, 2],
+    }
+    for array in arrays.values():
+        array.flags.writeable = False
+    return arrays
+_RISK_FIELD_IDX = {field: i for i, field in enumerate(RISK_FIELDS)}
+
+def risk_param_view(strategy: str, field: str) -> float:
+    """Read a single value from RISK_PARAMS by strategy name and field name"""
+    return float(RISK_PARAMS[STRAT_IDX[strategy], _RISK_FIELD_IDX[field]])
+
+# ========== DERIVED STOP LOSS / TAKE PROFIT MULTIPLIERS ==========
+# Entry price * multiplier gives the SL/TP level, e.g. BotConfig.TTM_SL_MULT_LONG
+# = 1 - TTM_STOP_LOSS_PERCENT. Sets <PREFIX>_SL_MULT_LONG, _TP_MULT_LONG,
+# _SL_MULT_SHORT and _TP_MULT_SHORT for each prefix below
+_SL_TP_SOURCES = (
+    ("ULTRA_SCALP", "ULTRA_SCALP_STOP_LOSS_PERCENT", "ULTRA_SCALP_TAKE_PROFIT_PERCENT"),
+    ("FAST_SCALP", "FAST_SCALP_STOP_LOSS_PERCENT", "FAST_SCALP_TAKE_PROFIT_PERCENT"),
+    ("QUICK_MOMENTUM", "QUICK_MOMENTUM_STOP_LOSS", "QUICK_MOMENTUM_PROFIT_TARGET"),
+    ("TTM", "TTM_STOP_LOSS_PERCENT", "TTM_TAKE_PROFIT_PERCENT"),
+)
+
+def _sl_tp_multipliers(cfg):
+    """SL/TP price multipliers for every strategy of a config class"""
+    values = {}
+    for prefix, sl_attr, tp_attr in _SL_TP_SOURCES:
+        stop_loss = getattr(cfg, sl_attr)
+        take_profit = getattr(cfg, tp_attr)
+        values[f"{prefix}_SL_MULT_LONG"] = 1.0 - stop_loss
+        values[f"{prefix}_TP_MULT_LONG"] = 1.0 + take_profit
+        values[f"{prefix}_SL_MULT_SHORT"] = 1.0 + stop_loss
+        values[f"{prefix}_TP_MULT_SHORT"] = 1.0 - take_profit
+    return values
+
+# ========== CREDENTIAL PLACEHOLDER CHECKS ==========
+def _is_placeholder(value) -> bool:
+    """True for empty credentials or the "YOUR_..." / "your_..._here" template values"""
+    value = str(value or "").strip()
+    return not value or value.lower().startswith("your_")
+
+# These read the credentials, so they are lazy as well: computed on first access
+# and dropped by _rebuild_derived() so the next read sees refreshed values
+_LAZY_DERIVED["EFFECTIVE_TELEGRAM_ENABLED"] = lambda: bool(
+    BotConfig.TELEGRAM_ENABLED
+    and not _is_placeholder(BotConfig.TELEGRAM_BOT_TOKEN)
+    and not _is_placeholder(BotConfig.TELEGRAM_CHAT_ID)
+)
+_LAZY_DERIVED["HAS_COINBASE_CREDENTIALS"] = lambda: not (
+    _is_placeholder(BotConfig.COINBASE_API_KEY)
+    or _is_placeholder(BotConfig.COINBASE_API_SECRET)
+)
+_LAZY_DERIVED["HAS_HYPERLIQUID_CREDENTIALS"] = lambda: not (
+    _is_placeholder(BotConfig.HYPERLIQUID_API_KEY)
+    or _is_placeholder(BotConfig.HYPERLIQUID_API_SECRET)
+)
+
+# ========== CREDENTIALS ==========
+# Secrets never live in this file: each one comes from its environment variable
+# (or config.json) and get_credentials() keeps the resolved set until the next load()
+@functools.lru_cache(maxsize=1)
+def get_credentials():
+    """Read-only mapping of every credential setting, resolved once until the next load()"""
+    return MappingProxyType({name: getattr(BotConfig, name) for name in BotConfig.__lazy_settings__})
+
+def _reset_lazy_derived():
+    """Forget cached lazy values so they are recomputed or re-read on next access"""
+    stale = _LAZY_DERIVED.keys() | (BotConfig.__lazy_settings__.keys() - _LOADED_LAZY_SETTINGS)
+    for name in stale:
+        if name in vars(BotConfig):
+            type.__delattr__(BotConfig, name)
+    # Cleared here, after the cached settings are gone, so it resolves fresh values
+    get_credentials.cache_clear()
+
+# ========== FLAT CONFIG SNAPSHOT ==========
+# CFG_VALS[CFG.ULTRA_SCALP_RSI_PERIOD] indexes a plain tuple instead of doing a
+# class attribute lookup; CFG_VIEW is a read-only name -> value mapping of the
+# same snapshot for everything else. Offsets are fixed at import
+def _build_config_snapshot():
+    """Capture every public BotConfig value into CFG_VALS / CFG_VIEW"""
+    global CFG, CFG_VALS, CFG_VIEW
+    if CFG is None:
+        keys = sorted(key for key in vars(BotConfig) if key.isupper())
+        CFG = IntEnum("CFG", {key: i for i, key in enumerate(keys)})
+    CFG_VALS = tuple(getattr(BotConfig, member.name) for member in CFG)
+    CFG_VIEW = MappingProxyType(dict(zip(CFG.__members__, CFG_VALS)))
+
+# ========== DERIVED UNIT CONVERSIONS ==========
+# BotConfig.D holds values already converted to the unit the hot paths use:
+# <PREFIX>_MAX_HOLD_NS for time.monotonic_ns() comparisons and the dynamic risk
+# defaults (stored in percent) as price ratios, e.g. D.DYNAMIC_ULTRA_SCALP_SL_RATIO
+_MAX_HOLD_SOURCES = (
+    ("ULTRA_SCALP", "ULTRA_SCALP_MAX_HOLD_SECONDS"),
+    ("FAST_SCALP", "FAST_SCALP_MAX_HOLD_SECONDS"),
+    ("QUICK_MOMENTUM", "QUICK_MOMENTUM_MAX_HOLD_SECONDS"),
+    ("TTM", "TTM_MAX_HOLD_SECONDS"),
+)
+
+def _unit_conversions(cfg):
+    """Read-only D namespace of ratios and nanosecond hold times for a config class"""
+    values = {
+        f"{prefix}_MAX_HOLD_NS": int(getattr(cfg, attr) * 1_000_000_000)
+        for prefix, attr in _MAX_HOLD_SOURCES
+    }
+    for key in sorted(cfg.__config_field_names__):
+        if key.startswith("DYNAMIC_") and key.endswith(("_SL", "_TP", "_PERCENT")):
+            values[f"{key.removesuffix('_PERCENT')}_RATIO"] = getattr(cfg, key) / 100.0
+    return _FrozenConfigMeta("_Derived", (), values)
+
+def _derived_class_values(cfg):
+    """Aliases and derived attributes that live on a config class itself"""
+    values = {alias: getattr(cfg, source) for alias, source in _ALIASES.items()}
+    values.update({
+        "MODE_ID": Mode[cfg.MODE.upper()],
+        "D": _unit_conversions(cfg),
+    })
+    values.update(_sl_tp_multipliers(cfg))
+    return values
+
+def _rebuild_derived():
+    """Recompute every value derived from BotConfig after it changes"""
+    global SYMBOL_INDEX, RISK_PARAMS, RISK_TABLE, STRAT_RSI_PERIODS, STRAT_RSI_BUY, STRAT_RSI_SELL
+    global STRAT_STOP, STRAT_TARGET, STRAT_MAX_HOLD, WEIGHTS
+    # Strings loaded from config.json / BOT_* env are fresh objects; intern them like the literals
+    for key in BotConfig.__config_field_names__ - BotConfig.__lazy_settings__.keys():
+        value = vars(BotConfig).get(key)
+        if isinstance(value, str):
+            _set_config(key, sys.intern(value))
+    # Overrides arrive as JSON lists; keep symbols an interned tuple with a matching index
+    _set_config("TRADING_SYMBOLS", tuple(sys.intern(s) for s in BotConfig.TRADING_SYMBOLS))
+    SYMBOL_INDEX = {symbol: i for i, symbol in enumerate(BotConfig.TRADING_SYMBOLS)}
+    for key, value in _derived_class_values(BotConfig).items():
+        _set_config(key, value)
+    _reset_lazy_derived()
+    RISK_PARAMS = _build_risk_params()
+    RISK_TABLE = _build_risk_table()
+    arrays = _build_strategy_arrays()
+    STRAT_RSI_PERIODS = arrays["STRAT_RSI_PERIODS"]
+    STRAT_RSI_BUY = arrays["STRAT_RSI_BUY"]
+    STRAT_RSI_SELL = arrays["STRAT_RSI_SELL"]
+    STRAT_STOP = arrays["STRAT_STOP"]
+    STRAT_TARGET = arrays["STRAT_TARGET"]
+    STRAT_MAX_HOLD = arrays["STRAT_MAX_HOLD"]
+    WEIGHTS = arrays["WEIGHTS"]
+    _build_config_snapshot()
+
+SYMBOL_INDEX = {}
+RISK_PARAMS = None
+RISK_TABLE = None
+STRAT_RSI_PERIODS = STRAT_RSI_BUY = STRAT_RSI_SELL = None
+STRAT_STOP = STRAT_TARGET = STRAT_MAX_HOLD = None
+WEIGHTS = None
+CFG = None
+CFG_VALS = ()
+CFG_VIEW = MappingProxyType({})
+BotConfig.refresh()
+
+__all__ = ['BotConfig', 'Mode', 'StratId', 'WEIGHTS', 'ENV_PREFIX', 'STRAT_ULTRA', 'STRAT_FAST', 'STRAT_QM', 'STRAT_TTM', 'STRATEGY_NAMES',
+           'RISK_FIELDS', 'RISK_PARAMS', 'RISK_DTYPE', 'RISK_TABLE', 'STRAT_IDX', 'risk_param_view', 'CONFIG_JSON_PATH',
+           'CFG', 'CFG_VALS', 'CFG_VIEW', 'STRAT_RSI_PERIODS', 'STRAT_RSI_BUY', 'STRAT_RSI_SELL',
+           'STRAT_STOP', 'STRAT_TARGET', 'STRAT_MAX_HOLD', 'SYMBOL_INDEX', 'get_credentials']
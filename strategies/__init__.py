@@ -1,12 +1,32 @@
 # strategies/__init__.py
 
-from .signal_aggregator import SignalAggregator
-from .ultra_scalp import UltraScalpStrategy
-from .fast_scalp import FastScalpStrategy
-from .quick_momentum import QuickMomentumStrategy
-from .ttm_squeeze import TTMSqueezeStrategy
+import importlib
+
+# Strategy classes are imported on first access (PEP 562) so importing the
+# package doesn't pull in pandas/numpy until a strategy is actually used
+_LAZY = {
+    "Signal": (".base", "Signal"),
+    "SignalAggregator": (".signal_aggregator", "SignalAggregator"),
+    "UltraScalpStrategy": (".ultra_scalp", "UltraScalpStrategy"),
+    "FastScalpStrategy": (".fast_scalp", "FastScalpStrategy"),
+    "QuickMomentumStrategy": (".quick_momentum", "QuickMomentumStrategy"),
+    "TTMSqueezeStrategy": (".ttm_squeeze", "TTMSqueezeStrategy"),
+}
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
+    "Signal",
     "SignalAggregator",
     "UltraScalpStrategy",
     "FastScalpStrategy",
@@ -1,23 +1,65 @@
 # strategies/base.py
 
+import sys
 from abc import ABC
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Optional, TypedDict
+from cryptobot.utils.ta import rsi_array
 
-class Strategy(ABC):
-    def __init__(self, name: str):
-        self.name = name
+class Signal(TypedDict, total=False):
+    """
+    Shape of the dict every strategy returns. Signals stay plain dicts because
+    the aggregator and engine add keys to them (position_size, weighted_confidence...)
+    """
+    action: str
+    confidence: float
+    strategy: str
+    entry_price: float
+    stop_loss: Optional[float]
+    take_profit: Optional[float]
+    reason: str
+    max_hold_time: int
+    target_hold: str
 
-    def analyze_and_signal(self, df: pd.DataFrame, symbol: str) -> Dict[str, Any]:
-        raise NotImplementedError()
+class Strategy(ABC):
+    id = -1  # StratId of the concrete strategy, -1 for strategies without one
 
-    def _empty_signal(self, reason="No valid signal") -> Dict[str, Any]:
-        return {
+    def __init__(self, name: str, stop_loss: float = 0.0, take_profit: float = 0.0):
+        self.name = sys.intern(name)  # Signal and aggregator key lookups hit the identity check
+        # SL/TP as entry-price multipliers (fractions in, e.g. 0.0025), folded once here
+        self.sl_mult_long = 1.0 - stop_loss
+        self.tp_mult_long = 1.0 + take_profit
+        self.sl_mult_short = 1.0 + stop_loss
+        self.tp_mult_short = 1.0 - take_profit
+        # Hold signal built once; _empty_signal() copies it and fills in the reason
+        self._empty_template: Signal = {
             'action': 'hold',
             'confidence': 0.0,
             'strategy': self.name,
             'entry_price': 0.0,
             'stop_loss': None,
             'take_profit': None,
-            'reason': reason
+            'reason': ''
         }
+
+    def analyze_and_signal(self, df: pd.DataFrame, symbol: str) -> Signal:
+        raise NotImplementedError()
+
+    def analyze_and_signal_batch(self, dfs: Dict[str, pd.DataFrame]) -> Dict[str, Signal]:
+        """
+        Signals for several symbols in one call (symbol -> df in, symbol -> signal out)
+        Default runs analyze_and_signal per symbol in order; strategies with
+        array-based indicators can override it to work on all symbols at once
+        """
+        analyze = self.analyze_and_signal
+        return {symbol: analyze(df, symbol) for symbol, df in dfs.items()}
+
+    def _empty_signal(self, reason="No valid signal") -> Signal:
+        signal = self._empty_template.copy()
+        signal['reason'] = reason
+        return signal
+
+    def _calculate_rsi(self, data: np.ndarray, period: int) -> np.ndarray:
+        """RSI over a close array, shared by every strategy (50 where undefined)"""
+        return rsi_array(data, period)
@@ -6,172 +6,342 @@ All parameters moved to config.py for centralized management
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
-from cryptobot.config import BotConfig
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Any, NamedTuple, Tuple
+from cryptobot.config import BotConfig, StratId, STRAT_FAST
+from cryptobot.strategies.base import Strategy
+from cryptobot.utils._njit import NUMBA_AVAILABLE
+from cryptobot.utils.ta import ema_array, ewm_alpha, fast_scalp_core, fast_scalp_core_2d, macd_arrays, tail_mean
 
-class FastScalpStrategy:
+try:
+    import polars as pl
+except ImportError:  # Optional: only needed to pass polars frames in directly
+    pl = None
+
+
+def _close_volume(df) -> tuple:
+    """
+    (close, volume) float64 arrays from a pandas or polars frame, copied only
+    when a column is not float64 already, so the kernel always sees one dtype
+    """
+    if pl is not None and isinstance(df, pl.DataFrame):
+        close, volume = df.get_column('close').to_numpy(), df.get_column('volume').to_numpy()
+        return close.astype(np.float64, copy=False), volume.astype(np.float64, copy=False)
+    return (
+        df['close'].to_numpy(dtype=np.float64, copy=False),
+        df['volume'].to_numpy(dtype=np.float64, copy=False)
+    )
+
+class FastScalpParams(NamedTuple):
+    """Immutable Fast-Scalp parameters, read by field name in the hot path"""
+    min_data_points: int
+    rsi_period: int
+    macd_fast: int
+    macd_slow: int
+    macd_signal_period: int
+    ema_fast_span: int
+    ema_slow_span: int
+    volume_average_period: int
+    volume_surge_multiplier: float
+    rsi_oversold: float
+    rsi_overbought: float
+    rsi_distance_divisor: float
+    macd_bonus_max: float
+    volume_bonus_value: float
+    base_confidence: float
+    max_hold_seconds: int
+    stop_loss_percent: float
+    take_profit_percent: float
+
+    @classmethod
+    def from_config(cls, cfg=BotConfig) -> "FastScalpParams":
+        """Snapshot the current BotConfig (or a with_overrides() copy) Fast-Scalp values"""
+        return cls(
+            min_data_points=cfg.MIN_DATA_POINTS,
+            rsi_period=cfg.FAST_SCALP_RSI_PERIOD,
+            macd_fast=cfg.FAST_SCALP_MACD_FAST,
+            macd_slow=cfg.FAST_SCALP_MACD_SLOW,
+            macd_signal_period=cfg.FAST_SCALP_MACD_SIGNAL,
+            ema_fast_span=cfg.FAST_SCALP_EMA_FAST,
+            ema_slow_span=cfg.FAST_SCALP_EMA_SLOW,
+            volume_average_period=cfg.FAST_SCALP_VOLUME_AVERAGE_PERIOD,
+            volume_surge_multiplier=cfg.FAST_SCALP_VOLUME_SURGE_MULTIPLIER,
+            rsi_oversold=cfg.FAST_SCALP_RSI_OVERSOLD,
+            rsi_overbought=cfg.FAST_SCALP_RSI_OVERBOUGHT,
+            rsi_distance_divisor=cfg.FAST_SCALP_RSI_DISTANCE_DIVISOR,
+            macd_bonus_max=cfg.FAST_SCALP_MACD_BONUS_MAX,
+            volume_bonus_value=cfg.FAST_SCALP_VOLUME_BONUS,
+            base_confidence=cfg.FAST_SCALP_BASE_CONFIDENCE,
+            max_hold_seconds=cfg.FAST_SCALP_MAX_HOLD_SECONDS,
+            stop_loss_percent=cfg.FAST_SCALP_STOP_LOSS_PERCENT,
+            take_profit_percent=cfg.FAST_SCALP_TAKE_PROFIT_PERCENT,
+        )
+
+class FastScalpStrategy(Strategy):
     """Fast-scalp strategy using centralized parameters from config"""
     
-    def __init__(self):
-        self.name = "Fast-Scalp"
+    def __init__(self, cfg=BotConfig):
+        # Everything analyze_and_signal reads, snapshotted once from the config
+        self.config = FastScalpParams.from_config(cfg)
+        super().__init__(
+            STRAT_FAST,
+            stop_loss=self.config.stop_loss_percent,
+            take_profit=self.config.take_profit_percent
+        )
+        self.id = StratId.FAST_SCALP
+        # Hold signal built once; _empty_signal() copies it and fills in the reason
+        self._empty_template = {
+            'action': 'hold',
+            'confidence': 0.0,
+            'strategy': self.name,
+            'entry_price': 0,
+            'stop_loss': 0,
+            'take_profit': 0,
+            'reason': '',
+            'max_hold_time': self.config.max_hold_seconds,
+            'target_hold': f'{self.config.max_hold_seconds // 60} minutes'
+        }
+        # Kernel arguments after the closes: RSI period and the EWM smoothing
+        # factors, derived from the spans once here rather than on every tick
+        cfg = self.config
+        self.kernel_args = (
+            cfg.rsi_period,
+            ewm_alpha(cfg.macd_fast),
+            ewm_alpha(cfg.macd_slow),
+            ewm_alpha(cfg.macd_signal_period),
+            ewm_alpha(cfg.ema_fast_span),
+            ewm_alpha(cfg.ema_slow_span)
+        )
+        if NUMBA_AVAILABLE:
+            self._warm_up_kernel()
+        
+    def _warm_up_kernel(self):
+        """Compile (or load from cache) the indicator kernels now instead of on the first tick"""
+        try:
+            closes = np.ones(max(self.config.min_data_points, 2))
+            fast_scalp_core(closes, *self.kernel_args)
+            fast_scalp_core_2d(closes[np.newaxis], *self.kernel_args)
+        except Exception as e:
+            print(f"⚠️ Fast-Scalp kernel warm-up failed: {e}")
         
     def analyze_and_signal(self, df: pd.DataFrame, symbol: str) -> Dict:
+        """df may be a pandas or a polars DataFrame with close/volume columns"""
         try:
-            if df.empty or len(df) < BotConfig.MIN_DATA_POINTS:
+            if not len(df) or len(df) < self.config.min_data_points:
                 return self._empty_signal('Insufficient data')
     
-            close = df['close']
-            high = df['high']
-            low = df['low']
-            volume = df['volume']
-            
-            # Calculate indicators using config parameters
-            rsi = self._calculate_rsi(close, BotConfig.FAST_SCALP_RSI_PERIOD)
-            macd, macd_signal, macd_hist = self._calculate_macd(
-                close, 
-                BotConfig.FAST_SCALP_MACD_FAST, 
-                BotConfig.FAST_SCALP_MACD_SLOW, 
-                BotConfig.FAST_SCALP_MACD_SIGNAL
-            )
-            
-            current_price = float(close.iloc[-1])
-            current_rsi = float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
-            current_macd = float(macd.iloc[-1]) if not pd.isna(macd.iloc[-1]) else 0.0
-            current_macd_signal = float(macd_signal.iloc[-1]) if not pd.isna(macd_signal.iloc[-1]) else 0.0
-            
-            # Volume analysis using config parameters
-            volume_avg = volume.rolling(BotConfig.FAST_SCALP_VOLUME_AVERAGE_PERIOD).mean().iloc[-1] if len(volume) >= BotConfig.FAST_SCALP_VOLUME_AVERAGE_PERIOD else volume.iloc[-1]
-            volume_surge = float(volume.iloc[-1]) > float(volume_avg) * BotConfig.FAST_SCALP_VOLUME_SURGE_MULTIPLIER
-            
-            # RSI momentum check instead of price change
-            rsi_series = rsi.dropna()
-            rsi_momentum_up = False
-            rsi_momentum_down = False
-
-            # Replace MACD with EMA crossover
-            ema_fast = close.ewm(span=BotConfig.FAST_SCALP_EMA_FAST, adjust=False).mean()
-            ema_slow = close.ewm(span=BotConfig.FAST_SCALP_EMA_SLOW, adjust=False).mean()
-            
-            if len(rsi_series) >= 2:  # Need at least 2 periods for momentum
-                # Get current and previous RSI values
-                current_rsi_val = rsi_series.iloc[-1]
-                prev_rsi_val = rsi_series.iloc[-2]  # Previous candle's RSI
-                
-                # Check RSI momentum direction
-                rsi_momentum_up = current_rsi_val > prev_rsi_val
-                rsi_momentum_down = current_rsi_val < prev_rsi_val
-    
-            confidence = 0.0
-            action = 'hold'
-            reason = 'No signal'
+            cv, vv = _close_volume(df)
             
-            # BUY SIGNAL using RSI momentum instead of price change
-            if (current_rsi < BotConfig.FAST_SCALP_RSI_OVERSOLD and
-                ema_fast.iloc[-1] > ema_slow.iloc[-1] and 
-                #current_macd > current_macd_signal and  # MACD bullish crossover
-                rsi_momentum_up):  # RSI showing upward momentum
-                
-                action = 'buy'
-                
-                # Confidence calculation using config parameters
-                base_confidence = BotConfig.FAST_SCALP_BASE_CONFIDENCE
-                rsi_bonus = max(0, (BotConfig.FAST_SCALP_RSI_OVERSOLD - current_rsi) / BotConfig.FAST_SCALP_RSI_DISTANCE_DIVISOR)
-                macd_bonus = min(BotConfig.FAST_SCALP_MACD_BONUS_MAX, max(0, (current_macd - current_macd_signal) / 100))
-                volume_bonus = BotConfig.FAST_SCALP_VOLUME_BONUS if volume_surge else 0.0
-                
-                confidence = min(0.9, base_confidence + rsi_bonus + macd_bonus + volume_bonus)
-                reason = f'Fast-scalp BUY: RSI={current_rsi:.1f} (↑), MACD={current_macd:.4f}'
-                
-            # SELL SIGNAL using RSI momentum instead of price change
-            elif (current_rsi > BotConfig.FAST_SCALP_RSI_OVERBOUGHT and
-                  current_macd < current_macd_signal and  # MACD bearish crossover
-                  rsi_momentum_down):  # RSI showing downward momentum
-                
-                action = 'sell'
-                
-                # Confidence calculation using config parameters
-                base_confidence = BotConfig.FAST_SCALP_BASE_CONFIDENCE
-                rsi_bonus = max(0, (current_rsi - BotConfig.FAST_SCALP_RSI_OVERBOUGHT) / BotConfig.FAST_SCALP_RSI_DISTANCE_DIVISOR)
-                macd_bonus = min(BotConfig.FAST_SCALP_MACD_BONUS_MAX, max(0, (current_macd_signal - current_macd) / 100))
-                volume_bonus = BotConfig.FAST_SCALP_VOLUME_BONUS if volume_surge else 0.0
-                
-                confidence = min(0.9, base_confidence + rsi_bonus + macd_bonus + volume_bonus)
-                reason = f'Fast-scalp SELL: RSI={current_rsi:.1f} (↓), MACD={current_macd:.4f}'
+            # RSI, MACD and the EMA pair in one pass over the raw closes
+            # (compiled when numba is installed); only last values are used
+            prices = cv if NUMBA_AVAILABLE else cv.tolist()
+            indicators = fast_scalp_core(prices, *self.kernel_args)
+            return self._build_signal(cv, vv, indicators)
     
-            # Set stop loss and take profit using config parameters
-            if action == 'buy':
-                stop_loss = current_price * (1 - BotConfig.FAST_SCALP_STOP_LOSS_PERCENT)
-                take_profit = current_price * (1 + BotConfig.FAST_SCALP_TAKE_PROFIT_PERCENT)
-            elif action == 'sell':
-                stop_loss = current_price * (1 + BotConfig.FAST_SCALP_STOP_LOSS_PERCENT)
-                take_profit = current_price * (1 - BotConfig.FAST_SCALP_TAKE_PROFIT_PERCENT)
+        except Exception as e:
+            return self._empty_signal(f'Error: {e}')
+
+    def analyze_and_signal_batch(self, dfs: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+        """
+        Stacks equal-length windows into one (symbols, bars) array and runs the
+        indicator pass once per length; short windows go through analyze_and_signal
+        """
+        cfg = self.config
+        signals = {}
+        by_length = {}
+        for symbol, df in dfs.items():
+            if len(df) and len(df) >= cfg.min_data_points:
+                by_length.setdefault(len(df), []).append(symbol)
             else:
-                stop_loss = current_price
-                take_profit = current_price
+                signals[symbol] = self.analyze_and_signal(df, symbol)
     
-            return {
-                'action': action,
-                'confidence': confidence,
-                'strategy': self.name,
-                'entry_price': current_price,
-                'stop_loss': stop_loss,
-                'take_profit': take_profit,
-                'reason': reason,
-                'max_hold_time': BotConfig.FAST_SCALP_MAX_HOLD_SECONDS,
-                'target_hold': f'{BotConfig.FAST_SCALP_MAX_HOLD_SECONDS // 60} minutes',
-                'rsi': current_rsi,
-                'macd': current_macd,
-                'macd_signal': current_macd_signal,
-                'rsi_momentum': 'up' if rsi_momentum_up else 'down' if rsi_momentum_down else 'flat'
-            }
+        for symbols in by_length.values():
+            try:
+                arrays = [_close_volume(dfs[symbol]) for symbol in symbols]
+                closes = np.vstack([close for close, _ in arrays])
+                volumes = [volume for _, volume in arrays]
+                columns = fast_scalp_core_2d(closes, *self.kernel_args)
+            except Exception as e:
+                for symbol in symbols:
+                    signals[symbol] = self._empty_signal(f'Error: {e}')
+                continue
+            for row, symbol in enumerate(symbols):
+                try:
+                    indicators = [column[row].item() for column in columns]
+                    signals[symbol] = self._build_signal(closes[row], volumes[row], indicators)
+                except Exception as e:
+                    signals[symbol] = self._empty_signal(f'Error: {e}')
     
-        except Exception as e:
-            return self._empty_signal(f'Error: {e}')
+        # Same symbol order as the input
+        return {symbol: signals[symbol] for symbol in dfs}
 
+    def analyze_and_signal_history(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Signal for every bar of df in one vectorised pass (for backtests)
+        Row i matches analyze_and_signal(df.iloc[:i + 1]) minus the reason
+        text, without re-running the indicators on each growing prefix
+        """
+        cfg = self.config
+        cv = df['close'].to_numpy(dtype=np.float64, copy=False)
+        vv = df['volume'].to_numpy(dtype=np.float64, copy=False)
+        n = len(cv)
     
-    def _empty_signal(self, reason: str) -> Dict:
-        return {
-            'action': 'hold',
-            'confidence': 0.0,
-            'strategy': self.name,
-            'entry_price': 0,
-            'stop_loss': 0,
-            'take_profit': 0,
-            'reason': reason,
-            'max_hold_time': BotConfig.FAST_SCALP_MAX_HOLD_SECONDS,
-            'target_hold': f'{BotConfig.FAST_SCALP_MAX_HOLD_SECONDS // 60} minutes'
-        }
+        # Indicators are seeded at the first bar, so one pass over the whole
+        # history gives the same values as each prefix would on its own
+        rsi = self._calculate_rsi(cv, cfg.rsi_period)
+        macd, macd_signal, _ = self._calculate_macd(cv, cfg.macd_fast, cfg.macd_slow, cfg.macd_signal_period)
+        ema_fast = ema_array(cv, cfg.ema_fast_span)
+        ema_slow = ema_array(cv, cfg.ema_slow_span)
+        prev_rsi = np.concatenate(([50.0], rsi[:-1]))
+        momentum_up = rsi > prev_rsi
+        momentum_down = rsi < prev_rsi
     
-    def _calculate_rsi(self, data: pd.Series, period: int) -> pd.Series:
-        """Calculate RSI"""
-        try:
-            delta = data.diff()
-            gains = delta.where(delta > 0, 0)
-            losses = -delta.where(delta < 0, 0)
+        # Volume average per bar: last-window mean, or the bar itself early on
+        period = cfg.volume_average_period
+        volume_avg = vv.copy()
+        if n >= period:
+            volume_avg[period - 1:] = sliding_window_view(vv, period).sum(axis=1) / period
+        volume_bonus = np.where(vv > volume_avg * cfg.volume_surge_multiplier, cfg.volume_bonus_value, 0.0)
+    
+        ready = np.arange(1, n + 1) >= cfg.min_data_points
+        buy = ready & (rsi < cfg.rsi_oversold) & (ema_fast > ema_slow) & momentum_up
+        sell = ready & ~buy & (rsi > cfg.rsi_overbought) & (macd < macd_signal) & momentum_down
+    
+        macd_bonus_max = cfg.macd_bonus_max
+        buy_rsi_bonus = np.maximum((cfg.rsi_oversold - rsi) / cfg.rsi_distance_divisor, 0)
+        sell_rsi_bonus = np.maximum((rsi - cfg.rsi_overbought) / cfg.rsi_distance_divisor, 0)
+        buy_macd_bonus = np.minimum(np.maximum((macd - macd_signal) / 100, 0), macd_bonus_max)
+        sell_macd_bonus = np.minimum(np.maximum((macd_signal - macd) / 100, 0), macd_bonus_max)
+        confidence = np.where(
+            buy,
+            cfg.base_confidence + buy_rsi_bonus + buy_macd_bonus + volume_bonus,
+            np.where(sell, cfg.base_confidence + sell_rsi_bonus + sell_macd_bonus + volume_bonus, 0.0)
+        )
+        confidence = np.minimum(confidence, 0.9)
+    
+        entry_price = np.where(ready, cv, 0.0)
+        return pd.DataFrame({
+            'action': np.where(buy, 'buy', np.where(sell, 'sell', 'hold')),
+            'confidence': confidence,
+            'entry_price': entry_price,
+            'stop_loss': np.where(buy, cv * self.sl_mult_long, np.where(sell, cv * self.sl_mult_short, entry_price)),
+            'take_profit': np.where(buy, cv * self.tp_mult_long, np.where(sell, cv * self.tp_mult_short, entry_price)),
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'rsi_momentum': np.where(momentum_up, 'up', np.where(momentum_down, 'down', 'flat')),
+        }, index=df.index)
+
+    def _build_signal(self, cv: np.ndarray, vv: np.ndarray, indicators) -> Dict:
+        """Entry rules on the last-bar indicator values from fast_scalp_core()"""
+        # Bind the params snapshot once so the rest of the call uses locals
+        cfg = self.config
+        volume_average_period = cfg.volume_average_period
+        volume_surge_multiplier = cfg.volume_surge_multiplier
+        rsi_oversold = cfg.rsi_oversold
+        rsi_overbought = cfg.rsi_overbought
+        rsi_distance_divisor = cfg.rsi_distance_divisor
+        macd_bonus_max = cfg.macd_bonus_max
+        volume_bonus_value = cfg.volume_bonus_value
+        base_confidence = cfg.base_confidence
+        sl_mult_long = self.sl_mult_long
+        tp_mult_long = self.tp_mult_long
+        sl_mult_short = self.sl_mult_short
+        tp_mult_short = self.tp_mult_short
+
+        (current_rsi, prev_rsi_val, current_macd, current_macd_signal,
+         ema_fast, ema_slow) = indicators
+        current_price = float(cv[-1])
+        
+        # Volume analysis using config parameters. It only feeds the
+        # confidence bonus, so skip it while RSI sits between the two
+        # thresholds (no entry is possible, and that's most ticks)
+        volume_surge = False
+        if current_rsi < rsi_oversold or current_rsi > rsi_overbought:
+            volume_avg = tail_mean(vv, volume_average_period)
+            volume_surge = float(vv[-1]) > volume_avg * volume_surge_multiplier
+        
+        # RSI momentum check instead of price change
+        rsi_momentum_up = False
+        rsi_momentum_down = False
+        
+        if len(cv) >= 2:  # Need at least 2 periods for momentum
+            # Check RSI momentum direction against the previous candle's RSI
+            rsi_momentum_up = current_rsi > prev_rsi_val
+            rsi_momentum_down = current_rsi < prev_rsi_val
+
+        confidence = 0.0
+        action = 'hold'
+        reason = 'No signal'
+        # Same for either side; clamps below are conditional expressions
+        # rather than min()/max() calls
+        volume_bonus = volume_bonus_value if volume_surge else 0.0
+        
+        # BUY SIGNAL using RSI momentum instead of price change
+        if (current_rsi < rsi_oversold and
+            ema_fast > ema_slow and 
+            #current_macd > current_macd_signal and  # MACD bullish crossover
+            rsi_momentum_up):  # RSI showing upward momentum
             
-            avg_gains = gains.ewm(span=period, adjust=False).mean()
-            avg_losses = losses.ewm(span=period, adjust=False).mean()
+            action = 'buy'
             
-            rs = avg_gains / avg_losses
-            rsi = 100 - (100 / (1 + rs))
+            # Confidence calculation using config parameters
+            rsi_bonus = (rsi_oversold - current_rsi) / rsi_distance_divisor
+            rsi_bonus = rsi_bonus if rsi_bonus > 0 else 0
+            macd_bonus = (current_macd - current_macd_signal) / 100
+            macd_bonus = macd_bonus_max if macd_bonus > macd_bonus_max else (macd_bonus if macd_bonus > 0 else 0)
             
-            return rsi.fillna(50)
-        except Exception as e:
-            return pd.Series([50] * len(data), index=data.index)
-    
-    def _calculate_macd(self, data: pd.Series, fast: int, slow: int, signal: int) -> tuple:
-        """Calculate MACD"""
-        try:
-            ema_fast = data.ewm(span=fast, adjust=False).mean()
-            ema_slow = data.ewm(span=slow, adjust=False).mean()
-            macd = ema_fast - ema_slow
-            macd_signal = macd.ewm(span=signal, adjust=False).mean()
-            macd_hist = macd - macd_signal
+            confidence = base_confidence + rsi_bonus + macd_bonus + volume_bonus
+            confidence = confidence if confidence < 0.9 else 0.9
+            reason = f'Fast-scalp BUY: RSI={current_rsi:.1f} (↑), MACD={current_macd:.4f}'
             
-            return macd, macd_signal, macd_hist
-        except Exception as e:
-            zeros = pd.Series([0] * len(data), index=data.index)
-            return zeros, zeros, zeros
+        # SELL SIGNAL using RSI momentum instead of price change
+        elif (current_rsi > rsi_overbought and
+              current_macd < current_macd_signal and  # MACD bearish crossover
+              rsi_momentum_down):  # RSI showing downward momentum
+            
+            action = 'sell'
+            
+            # Confidence calculation using config parameters
+            rsi_bonus = (current_rsi - rsi_overbought) / rsi_distance_divisor
+            rsi_bonus = rsi_bonus if rsi_bonus > 0 else 0
+            macd_bonus = (current_macd_signal - current_macd) / 100
+            macd_bonus = macd_bonus_max if macd_bonus > macd_bonus_max else (macd_bonus if macd_bonus > 0 else 0)
+            
+            confidence = base_confidence + rsi_bonus + macd_bonus + volume_bonus
+            confidence = confidence if confidence < 0.9 else 0.9
+            reason = f'Fast-scalp SELL: RSI={current_rsi:.1f} (↓), MACD={current_macd:.4f}'
+
+        # Set stop loss and take profit using config parameters
+        if action == 'buy':
+            stop_loss = current_price * sl_mult_long
+            take_profit = current_price * tp_mult_long
+        elif action == 'sell':
+            stop_loss = current_price * sl_mult_short
+            take_profit = current_price * tp_mult_short
+        else:
+            stop_loss = current_price
+            take_profit = current_price
+
+        # Start from the prebuilt hold signal (static keys and target_hold text
+        # already in place) and write only the per-tick fields; still a fresh
+        # dict per call because the aggregator adds keys to it
+        signal = self._empty_template.copy()
+        signal['action'] = action
+        signal['confidence'] = confidence
+        signal['entry_price'] = current_price
+        signal['stop_loss'] = stop_loss
+        signal['take_profit'] = take_profit
+        signal['reason'] = reason
+        signal['rsi'] = current_rsi
+        signal['macd'] = current_macd
+        signal['macd_signal'] = current_macd_signal
+        signal['rsi_momentum'] = 'up' if rsi_momentum_up else 'down' if rsi_momentum_down else 'flat'
+        return signal
+
+    def _calculate_macd(self, data: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate MACD as (macd, signal, histogram) arrays"""
+        return macd_arrays(data, fast, slow, signal)
 
 # Export the strategy class
 __all__ = ['FastScalpStrategy']
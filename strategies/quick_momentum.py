@@ -14,98 +14,78 @@ DESIGN PRINCIPLE:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
-from cryptobot.config import BotConfig
+from typing import Dict, Any, NamedTuple
+from cryptobot.config import BotConfig, StratId, STRAT_QM
+from cryptobot.strategies.base import Strategy
+from cryptobot.utils._njit import NUMBA_AVAILABLE
+from cryptobot.utils.ta import ema_array, gcp_growth_scan, gcp_plateau_scan, last_or, rsi_array, tail_mean
+
+class GCPParams(NamedTuple):
+    """Immutable GCP detector parameters, read by field name in the hot path"""
+    # Pattern detection windows
+    growth_detection_window: int
+    plateau_detection_window: int
+    
+    # GCP pattern requirements (more permissive for crypto)
+    min_growth_percentage: float
+    growth_consistency_threshold: float
+    plateau_volatility_threshold: float
+    plateau_drift_threshold: float
+    min_plateau_duration: int
+    
+    # GCP confidence thresholds
+    min_pattern_confidence: float
+    strong_pattern_confidence: float
+    
+    # Technical confirmation settings
+    use_technical_confirmation: bool
+    confirmation_weight: float
+    gcp_weight: float
+
+    @classmethod
+    def from_config(cls, cfg=BotConfig) -> "GCPParams":
+        """Snapshot the current BotConfig (or a with_overrides() copy) Quick-Momentum values"""
+        return cls(
+            growth_detection_window=cfg.QUICK_MOMENTUM_GROWTH_DETECTION_WINDOW,
+            plateau_detection_window=cfg.QUICK_MOMENTUM_PLATEAU_DETECTION_WINDOW,
+            min_growth_percentage=cfg.QUICK_MOMENTUM_MIN_GROWTH_PERCENTAGE,
+            growth_consistency_threshold=cfg.QUICK_MOMENTUM_GROWTH_CONSISTENCY_THRESHOLD,
+            plateau_volatility_threshold=cfg.QUICK_MOMENTUM_PLATEAU_VOLATILITY_THRESHOLD,
+            plateau_drift_threshold=cfg.QUICK_MOMENTUM_PLATEAU_DRIFT_THRESHOLD,
+            min_plateau_duration=cfg.QUICK_MOMENTUM_MIN_PLATEAU_DURATION,
+            min_pattern_confidence=cfg.QUICK_MOMENTUM_MIN_PATTERN_CONFIDENCE,
+            strong_pattern_confidence=cfg.QUICK_MOMENTUM_STRONG_PATTERN_CONFIDENCE,
+            use_technical_confirmation=cfg.QUICK_MOMENTUM_USE_TECHNICAL_CONFIRMATION,
+            confirmation_weight=cfg.QUICK_MOMENTUM_CONFIRMATION_WEIGHT,
+            gcp_weight=cfg.QUICK_MOMENTUM_GCP_WEIGHT,
+        )
 
 class PureGCPDetector:
     """Pure GCP Pattern Detector - GCP is the only trade trigger"""
     
-    def __init__(self):
+    def __init__(self, cfg=BotConfig):
         self.name = "Pure-GCP-Detector"
         self.pattern_history = {}
         
-        # GCP-focused configuration using BotConfig parameters
-        self.config = {
-            # Pattern detection windows
-            "growth_detection_window": BotConfig.QUICK_MOMENTUM_GROWTH_DETECTION_WINDOW,
-            "plateau_detection_window": BotConfig.QUICK_MOMENTUM_PLATEAU_DETECTION_WINDOW,
-            
-            # GCP pattern requirements (more permissive for crypto)
-            "min_growth_percentage": BotConfig.QUICK_MOMENTUM_MIN_GROWTH_PERCENTAGE,
-            "growth_consistency_threshold": BotConfig.QUICK_MOMENTUM_GROWTH_CONSISTENCY_THRESHOLD,
-            "plateau_volatility_threshold": BotConfig.QUICK_MOMENTUM_PLATEAU_VOLATILITY_THRESHOLD,
-            "plateau_drift_threshold": BotConfig.QUICK_MOMENTUM_PLATEAU_DRIFT_THRESHOLD,
-            "min_plateau_duration": BotConfig.QUICK_MOMENTUM_MIN_PLATEAU_DURATION,
-            
-            # GCP confidence thresholds
-            "min_pattern_confidence": BotConfig.QUICK_MOMENTUM_MIN_PATTERN_CONFIDENCE,
-            "strong_pattern_confidence": BotConfig.QUICK_MOMENTUM_STRONG_PATTERN_CONFIDENCE,
-            
-            # Technical confirmation settings
-            "use_technical_confirmation": BotConfig.QUICK_MOMENTUM_USE_TECHNICAL_CONFIRMATION,
-            "confirmation_weight": BotConfig.QUICK_MOMENTUM_CONFIRMATION_WEIGHT,
-            "gcp_weight": BotConfig.QUICK_MOMENTUM_GCP_WEIGHT,
-        }
-    
-    def _calculate_growth_score(self, prices: np.ndarray) -> float:
-        """Calculate growth consistency score"""
-        if len(prices) < 3:
-            return 0.0
-        price_changes = np.diff(prices)
-        if len(price_changes) == 0:
-            return 0.0
-        consistency = np.mean(price_changes > 0) if np.mean(price_changes) > 0 else np.mean(price_changes < 0)
-        return max(consistency, 1 - consistency)
-    
-    def _calculate_plateau_score(self, prices: np.ndarray) -> float:
-        """Calculate plateau stability score"""
-        if len(prices) < 3:
-            return 0.0
-        if np.mean(prices) == 0:
-            return 0.0
-            
-        # Calculate volatility as percentage of mean price
-        volatility = np.std(prices) / np.mean(prices)
-        
-        # Calculate drift as percentage change per period
-        # np.polyfit returns slope in price units per time unit
-        # Convert to percentage change per period
-        linear_slope = np.polyfit(np.arange(len(prices)), prices, 1)[0]
-        mean_price = np.mean(prices)
-        drift_percentage_per_period = (linear_slope / mean_price) * 100  # Convert to percentage
-        
-        # Score based on how close drift is to zero (consolidation)
-        volatility_score = max(0, 1 - (volatility / self.config["plateau_volatility_threshold"]))
-        
-        # Drift score: closer to zero = better consolidation
-        # Allow slight negative drift (slight decline during consolidation is normal)
-        drift_threshold = self.config["plateau_drift_threshold"]  # e.g., 0.5% per period
-        drift_score = max(0, 1 - (abs(drift_percentage_per_period) / drift_threshold))
-        
-        return (volatility_score * 0.6) + (drift_score * 0.4)  # Weight volatility more
+        # GCP-focused configuration using BotConfig (or a with_overrides() copy)
+        self.config = GCPParams.from_config(cfg)
     
     def _detect_growth_phase(self, prices: np.ndarray) -> Dict:
         """Detect growth/decline phase with flexible windows"""
-        max_window = self.config["growth_detection_window"]
+        max_window = self.config.growth_detection_window
+        min_growth = self.config.min_growth_percentage
+        consistency_threshold = self.config.growth_consistency_threshold
         if len(prices) < 5:
             return {"detected": False, "score": 0.0, "total_growth": 0.0}
         
-        best_growth = 0.0
-        best_score = 0.0
-        best_window_size = 0
-        
-        # Try different window sizes to find the best growth pattern
-        for window_size in range(5, min(len(prices), max_window) + 1):
-            growth_window = prices[-window_size:]
-            total_growth = (growth_window[-1] - growth_window[0]) / growth_window[0] * 100
-            growth_score = self._calculate_growth_score(growth_window)
-            
-            if (abs(total_growth) >= self.config["min_growth_percentage"] and 
-                growth_score >= self.config["growth_consistency_threshold"]):
-                if abs(total_growth) > abs(best_growth):
-                    best_growth = total_growth
-                    best_score = growth_score
-                    best_window_size = window_size
+        # One pass over the changes, widening the window from the end
+        # (compiled when numba is installed); tests/test_gcp_scan.py pins it to the old scoring
+        best_growth, best_score, best_window_size = gcp_growth_scan(
+            prices if NUMBA_AVAILABLE else prices.tolist(),
+            min_growth,
+            consistency_threshold,
+            max_window
+        )
         
         return {
             "detected": best_window_size > 0,
@@ -116,22 +96,20 @@ class PureGCPDetector:
     
     def _detect_plateau_phase(self, prices: np.ndarray) -> Dict:
         """Detect plateau/consolidation phase"""
-        max_window = self.config["plateau_detection_window"]
+        max_window = self.config.plateau_detection_window
+        min_duration = self.config.min_plateau_duration
         if len(prices) < 4:
             return {"detected": False, "score": 0.0}
         
-        best_score = 0.0
-        best_window_size = 0
-        
-        for window_size in range(4, min(len(prices), max_window) + 1):
-            plateau_window = prices[-window_size:]
-            plateau_score = self._calculate_plateau_score(plateau_window)
-            
-            if (plateau_score >= 0.25 and  # Lower threshold for more patterns
-                window_size >= self.config["min_plateau_duration"]):
-                if plateau_score > best_score:
-                    best_score = plateau_score
-                    best_window_size = window_size
+        # Volatility/drift score per window with the closed-form least-squares
+        # slope in place of np.polyfit; tests/test_gcp_scan.py pins it to the old scoring
+        best_score, best_window_size = gcp_plateau_scan(
+            prices if NUMBA_AVAILABLE else prices.tolist(),
+            self.config.plateau_volatility_threshold,
+            self.config.plateau_drift_threshold,
+            min_duration,
+            max_window
+        )
         
         return {
             "detected": best_window_size > 0,
@@ -139,27 +117,24 @@ class PureGCPDetector:
             "duration": best_window_size
         }
     
-    def _get_technical_confirmation(self, df: pd.DataFrame) -> Dict:
+    def _get_technical_confirmation(self, close: np.ndarray, volume: np.ndarray) -> Dict:
         """Get technical indicator confirmation (OPTIONAL enhancement only)"""
         try:
-            close = df['close']
-            volume = df['volume'] if 'volume' in df.columns else pd.Series([1]*len(df))
-            
-            current_price = float(close.iloc[-1])
+            current_price = float(close[-1])
             
             # RSI for momentum confirmation (not entry trigger)
             rsi = self._calculate_rsi(close, 14)
-            current_rsi = float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
+            current_rsi = float(rsi[-1])  # Already 50 where undefined
             
             # EMA alignment for trend confirmation
             ema_fast = self._calculate_ema(close, 5)
             ema_slow = self._calculate_ema(close, 13)
-            current_ema_fast = float(ema_fast.iloc[-1]) if not pd.isna(ema_fast.iloc[-1]) else current_price
-            current_ema_slow = float(ema_slow.iloc[-1]) if not pd.isna(ema_slow.iloc[-1]) else current_price
+            current_ema_fast = last_or(ema_fast, current_price)
+            current_ema_slow = last_or(ema_slow, current_price)
             
             # Volume confirmation
-            volume_avg = volume.rolling(10).mean().iloc[-1] if len(volume) >= 10 else volume.iloc[-1]
-            volume_ratio = float(volume.iloc[-1]) / float(volume_avg) if volume_avg > 0 else 1.0
+            volume_avg = tail_mean(volume, 10)
+            volume_ratio = float(volume[-1]) / volume_avg if volume_avg > 0 else 1.0
             
             # Calculate confirmation score (0.0 to 1.0)
             confirmation_score = 0.0
@@ -209,7 +184,9 @@ class PureGCPDetector:
                     'pattern_strength': 'none'
                 }
             
-            close_prices = df["close"].values
+            # Column arrays pulled once; the pattern scans and the technical
+            # confirmation below all read these
+            close_prices = df['close'].to_numpy(dtype=np.float64, copy=False)
             current_price = close_prices[-1]
             
             # STEP 1: DETECT GCP PATTERN (PRIMARY REQUIREMENT)
@@ -238,24 +215,25 @@ class PureGCPDetector:
             action = "buy" if pattern_direction == "bullish" else "sell"
             
             # Check minimum GCP confidence
-            if gcp_confidence < self.config["min_pattern_confidence"]:
+            if gcp_confidence < self.config.min_pattern_confidence:
                 return {
                     'detected': False,
                     'confidence': gcp_confidence,
-                    'reason': f'GCP pattern too weak: {gcp_confidence:.3f} < {self.config["min_pattern_confidence"]}',
+                    'reason': f'GCP pattern too weak: {gcp_confidence:.3f} < {self.config.min_pattern_confidence}',
                     'action': 'hold',
                     'pattern_strength': 'weak',
                     'raw_gcp_confidence': gcp_confidence
                 }
             
             # STEP 3: TECHNICAL CONFIRMATION (OPTIONAL ENHANCEMENT)
-            technical_conf = self._get_technical_confirmation(df)
+            volume = df['volume'].to_numpy(dtype=np.float64, copy=False) if 'volume' in df.columns else np.ones(len(df))
+            technical_conf = self._get_technical_confirmation(close_prices, volume)
             
             # Combine GCP strength with technical confirmation
-            if self.config["use_technical_confirmation"]:
+            if self.config.use_technical_confirmation:
                 final_confidence = (
-                    gcp_confidence * self.config["gcp_weight"] + 
-                    technical_conf["score"] * self.config["confirmation_weight"]
+                    gcp_confidence * self.config.gcp_weight + 
+                    technical_conf["score"] * self.config.confirmation_weight
                 )
             else:
                 final_confidence = gcp_confidence
@@ -264,9 +242,9 @@ class PureGCPDetector:
             final_confidence = min(0.85, final_confidence)
             
             # Pattern strength classification
-            if final_confidence >= self.config["strong_pattern_confidence"]:
+            if final_confidence >= self.config.strong_pattern_confidence:
                 pattern_strength = "strong"
-            elif final_confidence >= self.config["min_pattern_confidence"]:
+            elif final_confidence >= self.config.min_pattern_confidence:
                 pattern_strength = "moderate"
             else:
                 pattern_strength = "weak"
@@ -278,7 +256,7 @@ class PureGCPDetector:
                 f"Plateau: {plateau_result['score']:.2f} stability over {plateau_result['duration']}p"
             ]
             
-            if self.config["use_technical_confirmation"] and technical_conf["reasons"]:
+            if self.config.use_technical_confirmation and technical_conf["reasons"]:
                 reason_parts.append(f"Confirmed by: {', '.join(technical_conf['reasons'][:2])}")
             
             reason = " | ".join(reason_parts)
@@ -313,29 +291,16 @@ class PureGCPDetector:
                 'pattern_strength': 'error'
             }
     
-    def _calculate_ema(self, data: pd.Series, period: int) -> pd.Series:
+    def _calculate_ema(self, data: np.ndarray, period: int) -> np.ndarray:
         """Calculate EMA"""
-        return data.ewm(span=period, adjust=False).mean()
+        return ema_array(data, period)
     
-    def _calculate_rsi(self, data: pd.Series, period: int) -> pd.Series:
+    def _calculate_rsi(self, data: np.ndarray, period: int) -> np.ndarray:
         """Calculate RSI"""
-        try:
-            delta = data.diff()
-            gains = delta.where(delta > 0, 0)
-            losses = -delta.where(delta < 0, 0)
-            
-            avg_gains = gains.ewm(span=period, adjust=False).mean()
-            avg_losses = losses.ewm(span=period, adjust=False).mean()
-            
-            rs = avg_gains / avg_losses
-            rsi = 100 - (100 / (1 + rs))
-            
-            return rsi.fillna(50)
-        except Exception as e:
-            return pd.Series([50] * len(data), index=data.index)
+        return rsi_array(data, period)
 
 
-class QuickMomentumStrategy:
+class QuickMomentumStrategy(Strategy):
     """
     PURE GCP MOMENTUM STRATEGY
     
@@ -352,9 +317,29 @@ class QuickMomentumStrategy:
     - Works as drop-in replacement
     """
     
-    def __init__(self):
-        self.name = "Quick-Momentum"  # SAME name for compatibility
-        self.gcp_detector = PureGCPDetector()  # NOW the ONLY trading logic
+    def __init__(self, cfg=BotConfig):
+        super().__init__(
+            STRAT_QM,  # SAME name for compatibility
+            stop_loss=cfg.QUICK_MOMENTUM_STOP_LOSS,
+            take_profit=cfg.QUICK_MOMENTUM_PROFIT_TARGET
+        )
+        self.id = StratId.QUICK_MOMENTUM
+        self.max_hold_seconds = cfg.QUICK_MOMENTUM_MAX_HOLD_SECONDS
+        self.gcp_detector = PureGCPDetector(cfg)  # NOW the ONLY trading logic
+        # Hold signal built once; _empty_signal() copies it and fills in the reason
+        self._empty_template = {
+            'action': 'hold',
+            'confidence': 0.0,
+            'strategy': self.name,
+            'entry_price': 0,
+            'stop_loss': 0,
+            'take_profit': 0,
+            'reason': '',
+            'max_hold_time': self.max_hold_seconds,
+            'target_hold': f'{self.max_hold_seconds//60} minutes',
+            'gcp_pattern_detected': False,
+            'pattern_strength': 'insufficient_data'
+        }
         
     def analyze_and_signal(self, df: pd.DataFrame, symbol: str) -> Dict:
         """
@@ -365,8 +350,7 @@ class QuickMomentumStrategy:
             if df.empty or len(df) < 15:  # Need sufficient data for GCP
                 return self._empty_signal('Insufficient data for GCP pattern analysis')
 
-            close = df['close']
-            current_price = float(close.iloc[-1])
+            current_price = float(df['close'].values[-1])
             
             # ONLY GCP PATTERN DETECTION - no fallback logic
             gcp_result = self.gcp_detector.detect_gcp(df)
@@ -388,11 +372,11 @@ class QuickMomentumStrategy:
             
             # Calculate stop loss and take profit using BotConfig
             if action == 'buy':
-                stop_loss = current_price * (1 - BotConfig.QUICK_MOMENTUM_STOP_LOSS)
-                take_profit = current_price * (1 + BotConfig.QUICK_MOMENTUM_PROFIT_TARGET)
+                stop_loss = current_price * self.sl_mult_long
+                take_profit = current_price * self.tp_mult_long
             else:  # sell
-                stop_loss = current_price * (1 + BotConfig.QUICK_MOMENTUM_STOP_LOSS)
-                take_profit = current_price * (1 - BotConfig.QUICK_MOMENTUM_PROFIT_TARGET)
+                stop_loss = current_price * self.sl_mult_short
+                take_profit = current_price * self.tp_mult_short
             
             # Enhanced reason with GCP details
             reason = f"PURE GCP {action.upper()}: {gcp_result['reason']}"
@@ -406,8 +390,8 @@ class QuickMomentumStrategy:
                 'stop_loss': stop_loss,
                 'take_profit': take_profit,
                 'reason': reason,
-                'max_hold_time': BotConfig.QUICK_MOMENTUM_MAX_HOLD_SECONDS,
-                'target_hold': f'{BotConfig.QUICK_MOMENTUM_MAX_HOLD_SECONDS//60} minutes',
+                'max_hold_time': self.max_hold_seconds,
+                'target_hold': f'{self.max_hold_seconds//60} minutes',
                 
                 # GCP-specific information (bonus fields)
                 'gcp_pattern_detected': True,
@@ -429,35 +413,13 @@ class QuickMomentumStrategy:
 
     def _create_hold_signal(self, current_price: float, reason: str) -> Dict:
         """Create hold signal with current price"""
-        return {
-            'action': 'hold',
-            'confidence': 0.0,
-            'strategy': self.name,
-            'entry_price': current_price,
-            'stop_loss': current_price,
-            'take_profit': current_price,
-            'reason': reason,
-            'max_hold_time': BotConfig.QUICK_MOMENTUM_MAX_HOLD_SECONDS,
-            'target_hold': f'{BotConfig.QUICK_MOMENTUM_MAX_HOLD_SECONDS//60} minutes',
-            'gcp_pattern_detected': False,
-            'pattern_strength': 'none'
-        }
-
-    def _empty_signal(self, reason: str) -> Dict:
-        """SAME empty signal format as original"""
-        return {
-            'action': 'hold',
-            'confidence': 0.0,
-            'strategy': self.name,
-            'entry_price': 0,
-            'stop_loss': 0,
-            'take_profit': 0,
-            'reason': reason,
-            'max_hold_time': BotConfig.QUICK_MOMENTUM_MAX_HOLD_SECONDS,
-            'target_hold': f'{BotConfig.QUICK_MOMENTUM_MAX_HOLD_SECONDS//60} minutes',
-            'gcp_pattern_detected': False,
-            'pattern_strength': 'insufficient_data'
-        }
+        signal = self._empty_template.copy()
+        signal['entry_price'] = current_price
+        signal['stop_loss'] = current_price
+        signal['take_profit'] = current_price
+        signal['reason'] = reason
+        signal['pattern_strength'] = 'none'
+        return signal
 
 # Export the strategy class - SAME as original
 __all__ = ['QuickMomentumStrategy']
@@ -7,9 +7,11 @@ Fixes issues with signal filtering while preserving strategy integrity
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
-from cryptobot.config import BotConfig
+from cryptobot import config as bot_config
+from cryptobot.config import BotConfig, STRAT_ULTRA, STRAT_FAST, STRAT_QM, STRAT_TTM
 from cryptobot.strategies.ultra_scalp import UltraScalpStrategy
 from cryptobot.strategies.fast_scalp import FastScalpStrategy
 from cryptobot.strategies.quick_momentum import QuickMomentumStrategy
@@ -20,41 +22,39 @@ logger = logging.getLogger(__name__)
 class SignalAggregator:
     def __init__(self, portfolio=None):
         self.strategies = {
-            'Ultra-Scalp': UltraScalpStrategy(),
-            'Fast-Scalp': FastScalpStrategy(),
-            'Quick-Momentum': QuickMomentumStrategy(),
-            'TTM-Squeeze': TTMSqueezeStrategy()
+            STRAT_ULTRA: UltraScalpStrategy(),
+            STRAT_FAST: FastScalpStrategy(),
+            STRAT_QM: QuickMomentumStrategy(),
+            STRAT_TTM: TTMSqueezeStrategy()
         }
-        # FIXED: Don't access weights during __init__ to avoid import issues
-        self._weights = None
         
         # Reference for position checking
         self.portfolio = portfolio
         
         # Strategy-specific configurations (all use 1-minute data)
         self.strategy_configs = {
-            'Ultra-Scalp': {
+            STRAT_ULTRA: {
                 'timeframe': '1m',
                 'lookback': 10,  # Needs 10 minutes of 1-minute data
                 'max_hold_time': BotConfig.ULTRA_SCALP_MAX_HOLD_SECONDS,
                 'target_hold': f'{BotConfig.ULTRA_SCALP_MAX_HOLD_SECONDS//60} minutes',
                 'description': 'Ultra-fast scalping with 1-minute data'
             },
-            'Fast-Scalp': {
+            STRAT_FAST: {
                 'timeframe': '1m',
                 'lookback': 15,  # Needs 15 minutes of 1-minute data
                 'max_hold_time': BotConfig.FAST_SCALP_MAX_HOLD_SECONDS,
                 'target_hold': f'{BotConfig.FAST_SCALP_MAX_HOLD_SECONDS//60} minutes',
                 'description': 'Fast scalping with 1-minute data'
             },
-            'Quick-Momentum': {
+            STRAT_QM: {
                 'timeframe': '1m',
                 'lookback': 20,  # Needs 20 minutes of 1-minute data
                 'max_hold_time': BotConfig.QUICK_MOMENTUM_MAX_HOLD_SECONDS,
                 'target_hold': f'{BotConfig.QUICK_MOMENTUM_MAX_HOLD_SECONDS//60} minutes',
                 'description': 'Momentum trading with 1-minute data'
             },
-            'TTM-Squeeze': {
+            STRAT_TTM: {
                 'timeframe': '1m',
                 'lookback': 20,  # Needs 20 minutes of 1-minute data
                 'max_hold_time': BotConfig.TTM_SQUEEZE_MAX_HOLD_SECONDS,
@@ -65,22 +65,6 @@ class SignalAggregator:
         
         # Debug mode for detailed logging
         self.debug_mode = True
-    
-    @property
-    def weights(self):
-        """Lazy-load weights to avoid import issues"""
-        if self._weights is None:
-            try:
-                self._weights = BotConfig.STRATEGY_WEIGHTS
-            except AttributeError:
-                # Fallback weights if config not available
-                self._weights = {
-                    "Ultra-Scalp": 0.8,
-                    "Fast-Scalp": 0.9,
-                    "Quick-Momentum": 1.0,
-                    "TTM-Squeeze": 1.1
-                }
-        return self._weights
 
     def aggregate(self, market_data: Dict, symbol: str) -> List[Dict]:
         """
@@ -88,6 +72,7 @@ class SignalAggregator:
         FIXED: Properly apply agreement logic and provide detailed logging
         """
         all_signals = []
+        signal_ids = []  # StratId per entry in all_signals, for the weight lookup
         
         if self.debug_mode:
             print(f"\n{'='*60}\n🔍 ANALYZING {symbol}\n{'='*60}")
@@ -159,14 +144,18 @@ class SignalAggregator:
                     'lookback_periods': lookback,
                     'max_hold_time': config['max_hold_time'],
                     'target_hold': config['target_hold'],
-                    'description': config['description'],
-                    'weighted_confidence': signal['confidence'] * self.weights.get(strategy_name, 1.0)
+                    'description': config['description']
                 })
                 
                 # FIXED: Don't filter by confidence threshold here - collect ALL valid signals
                 # Only add signals that have valid actions (not 'hold')
                 if signal['action'] != 'hold':
+                    # WEIGHTS is indexed by StratId; -1 would silently pick the last row
+                    if strategy.id < 0:
+                        logger.warning(f"⚠️ {strategy_name} has no StratId - skipping its {signal['action']} signal")
+                        continue
                     all_signals.append(signal)
+                    signal_ids.append(strategy.id)
                     if self.debug_mode:
                         print(f"✅ {strategy_name} generated valid signal: {signal['action']} (conf: {signal['confidence']:.3f})")
                 else:
@@ -179,6 +168,13 @@ class SignalAggregator:
                     import traceback
                     traceback.print_exc()
         
+        # Weight every collected signal in one vectorized multiply
+        if all_signals:
+            confidences = np.fromiter((s['confidence'] for s in all_signals), dtype=np.float64, count=len(all_signals))
+            weighted = confidences * bot_config.WEIGHTS[signal_ids]
+            for signal, weighted_confidence in zip(all_signals, weighted.tolist()):
+                signal['weighted_confidence'] = weighted_confidence
+        
         # FIXED: Apply proper agreement logic (requires signals from multiple strategies)
         return self._apply_proper_agreement_logic(all_signals, symbol)
 
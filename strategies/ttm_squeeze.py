@@ -7,52 +7,96 @@ All input/output interfaces preserved for compatibility
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
-from cryptobot.config import BotConfig
+from typing import Dict, Any, NamedTuple
+from cryptobot.config import BotConfig, StratId, STRAT_TTM
+from cryptobot.strategies.base import Strategy
+from cryptobot.utils.ta import last_or
 
-class TTMSqueezeStrategy:
+class TTMSqueezeParams(NamedTuple):
+    """Immutable TTM-Squeeze parameters, read by field name in the hot path"""
+    # Bollinger Bands
+    bb_period: int
+    bb_std_dev: float
+    
+    # Keltner Channels
+    kc_period: int
+    kc_atr_multiplier: float
+    
+    # Donchian
+    donchian_period: int
+    
+    # CVD
+    cvd_period: int
+    
+    # Entry conditions
+    momentum_threshold: float
+    squeeze_persistence: int
+    
+    # Risk management
+    stop_loss_percent: float
+    take_profit_percent: float
+
+    adx_threshold: float
+    bb_width_percentile: float
+    max_hold_seconds: int
+
+    @classmethod
+    def from_config(cls, cfg=BotConfig) -> "TTMSqueezeParams":
+        """Snapshot the current BotConfig (or a with_overrides() copy) TTM values"""
+        return cls(
+            bb_period=cfg.TTM_BB_PERIOD,
+            bb_std_dev=cfg.TTM_BB_STD_DEV,
+            kc_period=cfg.TTM_KC_PERIOD,
+            kc_atr_multiplier=cfg.TTM_KC_ATR_MULTIPLIER,
+            donchian_period=cfg.TTM_DONCHIAN_PERIOD,
+            cvd_period=cfg.TTM_CVD_PERIOD,
+            momentum_threshold=cfg.TTM_MOMENTUM_THRESHOLD,
+            squeeze_persistence=cfg.TTM_SQUEEZE_PERSISTENCE,
+            stop_loss_percent=cfg.TTM_STOP_LOSS_PERCENT,
+            take_profit_percent=cfg.TTM_TAKE_PROFIT_PERCENT,
+            adx_threshold=cfg.TTM_ADX_THRESHOLD,
+            bb_width_percentile=cfg.TTM_BB_WIDTH_PERCENTILE,
+            max_hold_seconds=cfg.TTM_MAX_HOLD_SECONDS,
+        )
+
+class TTMSqueezeStrategy(Strategy):
     """TTM-Squeeze strategy - EXACT replica of complete bot version"""
     
-    def __init__(self):
-        self.name = "TTM-Squeeze"
+    def __init__(self, cfg=BotConfig):
+        # Load parameters from BotConfig (or a with_overrides() copy)
+        self.config = TTMSqueezeParams.from_config(cfg)
+        super().__init__(
+            STRAT_TTM,
+            stop_loss=self.config.stop_loss_percent,
+            take_profit=self.config.take_profit_percent
+        )
+        self.id = StratId.TTM_SQUEEZE
         self.squeeze_history = {}  # Track squeeze periods per symbol - CRITICAL for complete bot logic
         
-        # Load parameters from BotConfig
-        self.config = {
-            # Bollinger Bands
-            "bb_period": BotConfig.TTM_BB_PERIOD,
-            "bb_std_dev": BotConfig.TTM_BB_STD_DEV,
-            
-            # Keltner Channels
-            "kc_period": BotConfig.TTM_KC_PERIOD,
-            "kc_atr_multiplier": BotConfig.TTM_KC_ATR_MULTIPLIER,
-            
-            # Donchian
-            "donchian_period": BotConfig.TTM_DONCHIAN_PERIOD,
-            
-            # CVD
-            "cvd_period": BotConfig.TTM_CVD_PERIOD,
-            
-            # Entry conditions
-            "momentum_threshold": BotConfig.TTM_MOMENTUM_THRESHOLD,
-            "squeeze_persistence": BotConfig.TTM_SQUEEZE_PERSISTENCE,
-            
-            # Risk management
-            "stop_loss_percent": BotConfig.TTM_STOP_LOSS_PERCENT,
-            "take_profit_percent": BotConfig.TTM_TAKE_PROFIT_PERCENT,
-
-            "adx_threshold": BotConfig.TTM_ADX_THRESHOLD,
-            "bb_width_percentile": BotConfig.TTM_BB_WIDTH_PERCENTILE,
+        # Hold signal built once; _empty_signal() copies it and fills in the reason
+        self._empty_template = {
+            'action': 'hold',
+            'confidence': 0.0,
+            'strategy': self.name,
+            'entry_price': 0,
+            'stop_loss': 0,
+            'take_profit': 0,
+            'reason': '',
+            'max_hold_time': self.config.max_hold_seconds,
+            'target_hold': f'{self.config.max_hold_seconds//60} minutes'
         }
     
     def analyze_and_signal(self, df: pd.DataFrame, symbol: str) -> Dict:
         try:
+            # Bind the params snapshot once for the whole call
+            cfg = self.config
+
             # Use config period for data check
             min_periods = max(
-                self.config["bb_period"],
-                self.config["kc_period"],
-                self.config["donchian_period"],
-                self.config["cvd_period"]
+                cfg.bb_period,
+                cfg.kc_period,
+                cfg.donchian_period,
+                cfg.cvd_period
             )
             
             if len(df) < min_periods:
@@ -68,27 +112,23 @@ class TTMSqueezeStrategy:
             kc_upper, kc_middle, kc_lower = self._calculate_keltner_channels(high, low, close)
             donchian_midline = self._calculate_donchian_midline(high, low)
             cvd = self._calculate_cvd(volume, close)
-            # Add ADX calculation
             adx = self._calculate_adx(high, low, close, 14)
-            current_adx = adx.iloc[-1]
+            cvd_values = cvd.values
                     
             # Current values
-            current_price = float(close.iloc[-1])
-            current_bb_upper = float(bb_upper.iloc[-1]) if not pd.isna(bb_upper.iloc[-1]) else current_price * 1.02
-            current_bb_lower = float(bb_lower.iloc[-1]) if not pd.isna(bb_lower.iloc[-1]) else current_price * 0.98
-            current_kc_upper = float(kc_upper.iloc[-1]) if not pd.isna(kc_upper.iloc[-1]) else current_price * 1.02
-            current_kc_lower = float(kc_lower.iloc[-1]) if not pd.isna(kc_lower.iloc[-1]) else current_price * 0.98
-            current_donchian = float(donchian_midline.iloc[-1]) if not pd.isna(donchian_midline.iloc[-1]) else current_price
-            current_sma = float(bb_middle.iloc[-1]) if not pd.isna(bb_middle.iloc[-1]) else current_price
-            current_cvd = float(cvd.iloc[-1]) if not pd.isna(cvd.iloc[-1]) else 0
-
-            # Current values - add ADX after other indicators
-            adx = self._calculate_adx(high, low, close, 14)
-            current_adx = float(adx.iloc[-1]) if not pd.isna(adx.iloc[-1]) else 25
+            current_price = float(close.values[-1])
+            current_bb_upper = last_or(bb_upper.values, current_price * 1.02)
+            current_bb_lower = last_or(bb_lower.values, current_price * 0.98)
+            current_kc_upper = last_or(kc_upper.values, current_price * 1.02)
+            current_kc_lower = last_or(kc_lower.values, current_price * 0.98)
+            current_donchian = last_or(donchian_midline.values, current_price)
+            current_sma = last_or(bb_middle.values, current_price)
+            current_cvd = last_or(cvd.values, 0)
+            current_adx = last_or(adx.values, 25)
 
             # Add this after calculating Bollinger Bands
             bb_width = (bb_upper - bb_lower) / bb_middle
-            bb_width_percentile = bb_width.rank(pct=True).iloc[-1] * 100
+            bb_width_percentile = bb_width.rank(pct=True).values[-1] * 100
 
             # Check squeeze condition (EXACT same logic as complete bot)
             squeeze_on = (current_bb_upper < current_kc_upper and current_bb_lower > current_kc_lower)
@@ -109,8 +149,9 @@ class TTMSqueezeStrategy:
             # Calculate CVD momentum (COMPLETE BOT FEATURE - missing from original)
             cvd_momentum = 0
             if len(cvd) > 10:
-                cvd_change = current_cvd - float(cvd.iloc[-10])
-                cvd_momentum = cvd_change / abs(float(cvd.iloc[-10])) if cvd.iloc[-10] != 0 else 0
+                cvd_prev = float(cvd_values[-10])
+                cvd_change = current_cvd - cvd_prev
+                cvd_momentum = cvd_change / abs(cvd_prev) if cvd_prev != 0 else 0
             
             # Count consecutive squeeze periods (COMPLETE BOT LOGIC - missing from original)
             recent_squeeze_count = 0
@@ -125,10 +166,10 @@ class TTMSqueezeStrategy:
             reason = 'No TTM signal'
             
             # COMPLETE BOT ENTRY LOGIC 
-            if (self._check_squeeze_persistence(symbol, self.config["squeeze_persistence"]) and
-                abs(momentum_normalized) > self.config["momentum_threshold"] and
-                current_adx > BotConfig.TTM_ADX_THRESHOLD and  # New ADX filter
-                bb_width_percentile < BotConfig.TTM_BB_WIDTH_PERCENTILE):  # New BB width filter
+            if (self._check_squeeze_persistence(symbol, cfg.squeeze_persistence) and
+                abs(momentum_normalized) > cfg.momentum_threshold and
+                current_adx > cfg.adx_threshold and  # New ADX filter
+                bb_width_percentile < cfg.bb_width_percentile):  # New BB width filter
 
                 # Determine direction based on momentum
                 if momentum_normalized > 0:
@@ -155,38 +196,36 @@ class TTMSqueezeStrategy:
 
             # Set stop loss and take profit (COMPLETE BOT VALUES - different from original)
             if action == 'buy':
-                stop_loss = current_price * (1 - self.config["stop_loss_percent"])
-                take_profit = current_price * (1 + self.config["take_profit_percent"])
+                stop_loss = current_price * self.sl_mult_long
+                take_profit = current_price * self.tp_mult_long
             elif action == 'sell':
-                stop_loss = current_price * (1 + self.config["stop_loss_percent"])
-                take_profit = current_price * (1 - self.config["take_profit_percent"])
+                stop_loss = current_price * self.sl_mult_short
+                take_profit = current_price * self.tp_mult_short
             else:
                 stop_loss = current_price
                 take_profit = current_price
 
-            # Return in EXACT same format as original (interface preserved)
-            return {
-                'action': action,
-                'confidence': confidence,
-                'strategy': self.name,
-                'entry_price': current_price,
-                'stop_loss': stop_loss,
-                'take_profit': take_profit,
-                'reason': reason,
-                'max_hold_time': BotConfig.TTM_MAX_HOLD_SECONDS,
-                'target_hold': f'{BotConfig.TTM_MAX_HOLD_SECONDS//60} minutes',
-                # Additional complete bot data (keeping original interface plus new data)
-                'squeeze_on': squeeze_on,
-                'squeeze_count': recent_squeeze_count,
-                'momentum': momentum_normalized,
-                'cvd_momentum': cvd_momentum,
-                # Keep original interface elements that might be expected
-                'bb_position': (current_price - current_bb_lower) / (current_bb_upper - current_bb_lower) if (current_bb_upper - current_bb_lower) > 0 else 0.5,
-                'keltner_position': (current_price - current_kc_lower) / (current_kc_upper - current_kc_lower) if (current_kc_upper - current_kc_lower) > 0 else 0.5,
-                'volume_surge': False,  # Original had this, keeping for compatibility
-                'adx': current_adx,
-                'bb_width_percentile': bb_width_percentile,
-            }
+            # Return in EXACT same format as original (interface preserved):
+            # prebuilt hold signal plus the per-tick fields (fresh dict per call)
+            signal = self._empty_template.copy()
+            signal['action'] = action
+            signal['confidence'] = confidence
+            signal['entry_price'] = current_price
+            signal['stop_loss'] = stop_loss
+            signal['take_profit'] = take_profit
+            signal['reason'] = reason
+            # Additional complete bot data (keeping original interface plus new data)
+            signal['squeeze_on'] = squeeze_on
+            signal['squeeze_count'] = recent_squeeze_count
+            signal['momentum'] = momentum_normalized
+            signal['cvd_momentum'] = cvd_momentum
+            # Keep original interface elements that might be expected
+            signal['bb_position'] = (current_price - current_bb_lower) / (current_bb_upper - current_bb_lower) if (current_bb_upper - current_bb_lower) > 0 else 0.5
+            signal['keltner_position'] = (current_price - current_kc_lower) / (current_kc_upper - current_kc_lower) if (current_kc_upper - current_kc_lower) > 0 else 0.5
+            signal['volume_surge'] = False  # Original had this, keeping for compatibility
+            signal['adx'] = current_adx
+            signal['bb_width_percentile'] = bb_width_percentile
+            return signal
 
         except Exception as e:
             return self._empty_signal(f'TTM Error: {e}')
@@ -199,42 +238,11 @@ class TTMSqueezeStrategy:
         # Check last N periods
         return all(self.squeeze_history[symbol][-i] for i in range(1, required_periods+1))
     
-    def _empty_signal(self, reason: str) -> Dict:
-        """Same interface as original"""
-        return {
-            'action': 'hold',
-            'confidence': 0.0,
-            'strategy': self.name,
-            'entry_price': 0,
-            'stop_loss': 0,
-            'take_profit': 0,
-            'reason': reason,
-            'max_hold_time': BotConfig.TTM_MAX_HOLD_SECONDS,
-            'target_hold': f'{BotConfig.TTM_MAX_HOLD_SECONDS//60} minutes'
-        }
-    
-    def _calculate_rsi(self, data: pd.Series, period: int) -> pd.Series:
-        """Keep original RSI method for compatibility (even though not used in complete bot logic)"""
-        try:
-            delta = data.diff()
-            gains = delta.where(delta > 0, 0)
-            losses = -delta.where(delta < 0, 0)
-            
-            avg_gains = gains.ewm(span=period, adjust=False).mean()
-            avg_losses = losses.ewm(span=period, adjust=False).mean()
-            
-            rs = avg_gains / avg_losses
-            rsi = 100 - (100 / (1 + rs))
-            
-            return rsi.fillna(50)
-        except Exception as e:
-            return pd.Series([50] * len(data), index=data.index)
-    
     def _calculate_bollinger_bands(self, data: pd.Series, period: int = None, std_dev: float = None):
         """UPDATED - Complete bot method with min_periods handling"""
         try:
-            period = period or self.config["bb_period"]
-            std_dev = std_dev or self.config["bb_std_dev"]
+            period = period or self.config.bb_period
+            std_dev = std_dev or self.config.bb_std_dev
             
             sma = data.rolling(window=period, min_periods=1).mean()
             std = data.rolling(window=period, min_periods=1).std()
@@ -249,8 +257,8 @@ class TTMSqueezeStrategy:
     def _calculate_keltner_channels(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = None, atr_multiplier: float = None):
         """UPDATED - Complete bot method using close SMA (not typical price)"""
         try:
-            period = period or self.config["kc_period"]
-            atr_multiplier = atr_multiplier or self.config["kc_atr_multiplier"]
+            period = period or self.config.kc_period
+            atr_multiplier = atr_multiplier or self.config.kc_atr_multiplier
             
             # Complete bot uses close SMA, not typical price
             sma = close.rolling(window=period, min_periods=1).mean()
@@ -266,7 +274,7 @@ class TTMSqueezeStrategy:
     def _calculate_atr(self, high: pd.Series, low: pd.Series, close: pd.Series, period: int = None) -> pd.Series:
         """UPDATED - Complete bot method with min_periods handling"""
         try:
-            period = period or self.config["kc_period"]  # Use same period as Keltner
+            period = period or self.config.kc_period  # Use same period as Keltner
             
             prev_close = close.shift(1)
             tr1 = high - low
@@ -283,7 +291,7 @@ class TTMSqueezeStrategy:
     def _calculate_donchian_midline(self, high: pd.Series, low: pd.Series, period: int = None) -> pd.Series:
         """NEW METHOD - Complete bot feature missing from original"""
         try:
-            period = period or self.config["donchian_period"]
+            period = period or self.config.donchian_period
             
             highest_high = high.rolling(window=period, min_periods=1).max()
             lowest_low = low.rolling(window=period, min_periods=1).min()
@@ -6,91 +6,163 @@ All parameters moved to config.py for centralized management
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
-from cryptobot.config import BotConfig
+from typing import Dict, Any, NamedTuple
+from cryptobot.config import BotConfig, StratId, STRAT_ULTRA
+from cryptobot.strategies.base import Strategy
+from cryptobot.utils.ta import RsiState, last_or, sma_array, tail_mean
 
-class UltraScalpStrategy:
+class UltraScalpParams(NamedTuple):
+    """Immutable Ultra-Scalp parameters, read by field name in the hot path"""
+    min_data_points: int
+    rsi_period: int
+    sma_period: int
+    rsi_buy_threshold: float
+    rsi_sell_threshold: float
+    rsi_slope_threshold: float
+    rsi_distance_divisor: float
+    momentum_bonus_max: float
+    volume_bonus_value: float
+    base_confidence: float
+    max_hold_seconds: int
+    volume_average_period: int
+    volume_surge_threshold: float
+    price_change_threshold: float
+    stop_loss_percent: float
+    take_profit_percent: float
+
+    @classmethod
+    def from_config(cls, cfg=BotConfig) -> "UltraScalpParams":
+        """Snapshot the current BotConfig (or a with_overrides() copy) Ultra-Scalp values"""
+        return cls(
+            min_data_points=cfg.MIN_DATA_POINTS,
+            rsi_period=cfg.ULTRA_SCALP_RSI_PERIOD,
+            sma_period=cfg.ULTRA_SCALP_SMA_PERIOD,
+            rsi_buy_threshold=cfg.ULTRA_SCALP_RSI_BUY_THRESHOLD,
+            rsi_sell_threshold=cfg.ULTRA_SCALP_RSI_SELL_THRESHOLD,
+            rsi_slope_threshold=cfg.ULTRA_SCALP_RSI_SLOPE_THRESHOLD,
+            rsi_distance_divisor=cfg.ULTRA_SCALP_RSI_DISTANCE_DIVISOR,
+            momentum_bonus_max=cfg.ULTRA_SCALP_MOMENTUM_BONUS_MAX,
+            volume_bonus_value=cfg.ULTRA_SCALP_VOLUME_BONUS,
+            base_confidence=cfg.ULTRA_SCALP_BASE_CONFIDENCE,
+            max_hold_seconds=cfg.ULTRA_SCALP_MAX_HOLD_SECONDS,
+            volume_average_period=cfg.VOLUME_AVERAGE_PERIOD,
+            volume_surge_threshold=cfg.VOLUME_SURGE_THRESHOLD,
+            price_change_threshold=cfg.ULTRA_SCALP_PRICE_CHANGE_THRESHOLD,
+            stop_loss_percent=cfg.ULTRA_SCALP_STOP_LOSS_PERCENT,
+            take_profit_percent=cfg.ULTRA_SCALP_TAKE_PROFIT_PERCENT,
+        )
+
+class UltraScalpStrategy(Strategy):
     """Ultra-scalp strategy using centralized parameters from config"""
     
-    def __init__(self):
-        self.name = "Ultra-Scalp"
+    def __init__(self, cfg=BotConfig):
+        # Everything analyze_and_signal reads, snapshotted once from the config
+        self.config = UltraScalpParams.from_config(cfg)
+        super().__init__(
+            STRAT_ULTRA,
+            stop_loss=self.config.stop_loss_percent,
+            take_profit=self.config.take_profit_percent
+        )
+        self.id = StratId.ULTRA_SCALP
+        # Hold signal built once; _empty_signal() copies it and fills in the reason
+        self._empty_template = {
+            'action': 'hold',
+            'confidence': 0.0,
+            'strategy': self.name,
+            'entry_price': 0,
+            'stop_loss': 0,
+            'take_profit': 0,
+            'reason': '',
+            'max_hold_time': self.config.max_hold_seconds,
+            'target_hold': f'{self.config.max_hold_seconds // 60} minutes'
+        }
         
     def analyze_and_signal_old(self, df: pd.DataFrame, symbol: str) -> Dict:
         try:
-            if df.empty or len(df) < BotConfig.MIN_DATA_POINTS:
+            if df.empty or len(df) < self.config.min_data_points:
                 return self._empty_signal('Insufficient data')
 
-            close = df['close']
-            high = df['high']
-            low = df['low']
-            volume = df['volume']
+            # Bind the params snapshot once so the rest of the call uses locals
+            cfg = self.config
+            rsi_buy_threshold = cfg.rsi_buy_threshold
+            rsi_sell_threshold = cfg.rsi_sell_threshold
+            rsi_slope_threshold = cfg.rsi_slope_threshold
+            price_change_threshold = cfg.price_change_threshold
+            rsi_distance_divisor = cfg.rsi_distance_divisor
+            momentum_bonus_max = cfg.momentum_bonus_max
+            volume_bonus_value = cfg.volume_bonus_value
+            max_hold_seconds = cfg.max_hold_seconds
+
+            cv = df['close'].to_numpy(dtype=np.float64, copy=False)
+            vv = df['volume'].values
             
             # Calculate indicators using config parameters
-            rsi = self._calculate_rsi(close, BotConfig.ULTRA_SCALP_RSI_PERIOD)
-            sma = self._fast_sma(close, BotConfig.ULTRA_SCALP_SMA_PERIOD)
+            rsi = self._calculate_rsi(cv, cfg.rsi_period)
+            sma = self._fast_sma(cv, cfg.sma_period)
             
-            current_price = float(close.iloc[-1])
-            current_rsi = float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
-            current_sma = float(sma.iloc[-1]) if not pd.isna(sma.iloc[-1]) else current_price
+            # One float() per value read off the arrays; RSI is already 50 where
+            # undefined, so only the SMA keeps a NaN fallback
+            current_price = float(cv[-1])
+            current_rsi = float(rsi[-1])
+            current_sma = last_or(sma, current_price)
             
             # RSI Slope calculation using config parameters
             rsi_slope = 0.0
             if len(rsi) >= 3:
-                rsi_prev = float(rsi.iloc[-3]) if not pd.isna(rsi.iloc[-3]) else current_rsi
-                rsi_slope = current_rsi - rsi_prev
+                rsi_slope = current_rsi - float(rsi[-3])
             
             # Price Action confirmation using config parameters
-            price_change_1m = ((current_price / close.iloc[-2]) - 1) * 100 if len(close) > 1 else 0
+            price_change_1m = ((current_price / cv[-2]) - 1) * 100 if len(cv) > 1 else 0
             
             # Volume momentum using config parameters
-            volume_avg = volume.rolling(BotConfig.VOLUME_AVERAGE_PERIOD).mean().iloc[-1] if len(volume) >= BotConfig.VOLUME_AVERAGE_PERIOD else volume.iloc[-1]
-            volume_surge = float(volume.iloc[-1]) > float(volume_avg) * BotConfig.VOLUME_SURGE_THRESHOLD
+            volume_avg = tail_mean(vv, cfg.volume_average_period)
+            volume_surge = float(vv[-1]) > volume_avg * cfg.volume_surge_threshold
             
             confidence = 0.0
             action = 'hold'
             reason = 'No signal'
             
             # BUY SIGNAL using config parameters
-            if (current_rsi < BotConfig.ULTRA_SCALP_RSI_BUY_THRESHOLD and
-                (rsi_slope > BotConfig.ULTRA_SCALP_RSI_SLOPE_THRESHOLD or 
-                 price_change_1m > BotConfig.ULTRA_SCALP_PRICE_CHANGE_THRESHOLD)):
+            if (current_rsi < rsi_buy_threshold and
+                (rsi_slope > rsi_slope_threshold or 
+                 price_change_1m > price_change_threshold)):
                 
                 action = 'buy'
                 
                 # Confidence calculation using config parameters
-                base_confidence = BotConfig.ULTRA_SCALP_BASE_CONFIDENCE
-                rsi_distance = BotConfig.ULTRA_SCALP_RSI_BUY_THRESHOLD - current_rsi
-                momentum_bonus = min(BotConfig.ULTRA_SCALP_MOMENTUM_BONUS_MAX, 
+                base_confidence = cfg.base_confidence
+                rsi_distance = rsi_buy_threshold - current_rsi
+                momentum_bonus = min(momentum_bonus_max, 
                                    max(0, rsi_slope / 10 + price_change_1m / 100))
-                volume_bonus = BotConfig.ULTRA_SCALP_VOLUME_BONUS if volume_surge else 0.0
+                volume_bonus = volume_bonus_value if volume_surge else 0.0
                 
-                confidence = min(0.9, base_confidence + (rsi_distance / BotConfig.ULTRA_SCALP_RSI_DISTANCE_DIVISOR) + momentum_bonus + volume_bonus)
+                confidence = min(0.9, base_confidence + (rsi_distance / rsi_distance_divisor) + momentum_bonus + volume_bonus)
                 reason = f'Ultra-scalp BUY: RSI={current_rsi:.1f}(slope:{rsi_slope:.1f}), momentum={price_change_1m:.2f}%'
                 
             # SELL SIGNAL using config parameters
-            elif (current_rsi > BotConfig.ULTRA_SCALP_RSI_SELL_THRESHOLD and
-                  (rsi_slope < -BotConfig.ULTRA_SCALP_RSI_SLOPE_THRESHOLD or 
-                   price_change_1m < -BotConfig.ULTRA_SCALP_PRICE_CHANGE_THRESHOLD)):
+            elif (current_rsi > rsi_sell_threshold and
+                  (rsi_slope < -rsi_slope_threshold or 
+                   price_change_1m < -price_change_threshold)):
                 
                 action = 'sell'
                 
                 # Confidence calculation using config parameters
-                base_confidence = BotConfig.ULTRA_SCALP_BASE_CONFIDENCE
-                rsi_distance = current_rsi - BotConfig.ULTRA_SCALP_RSI_SELL_THRESHOLD
-                momentum_bonus = min(BotConfig.ULTRA_SCALP_MOMENTUM_BONUS_MAX, 
+                base_confidence = cfg.base_confidence
+                rsi_distance = current_rsi - rsi_sell_threshold
+                momentum_bonus = min(momentum_bonus_max, 
                                    max(0, abs(rsi_slope) / 10 + abs(price_change_1m) / 100))
-                volume_bonus = BotConfig.ULTRA_SCALP_VOLUME_BONUS if volume_surge else 0.0
+                volume_bonus = volume_bonus_value if volume_surge else 0.0
                 
-                confidence = min(0.9, base_confidence + (rsi_distance / BotConfig.ULTRA_SCALP_RSI_DISTANCE_DIVISOR) + momentum_bonus + volume_bonus)
+                confidence = min(0.9, base_confidence + (rsi_distance / rsi_distance_divisor) + momentum_bonus + volume_bonus)
                 reason = f'Ultra-scalp SELL: RSI={current_rsi:.1f}(slope:{rsi_slope:.1f}), momentum={price_change_1m:.2f}%'
 
             # Set stop loss and take profit using config parameters
             if action == 'buy':
-                stop_loss = current_price * (1 - BotConfig.ULTRA_SCALP_STOP_LOSS_PERCENT)
-                take_profit = current_price * (1 + BotConfig.ULTRA_SCALP_TAKE_PROFIT_PERCENT)
+                stop_loss = current_price * self.sl_mult_long
+                take_profit = current_price * self.tp_mult_long
             elif action == 'sell':
-                stop_loss = current_price * (1 + BotConfig.ULTRA_SCALP_STOP_LOSS_PERCENT)
-                take_profit = current_price * (1 - BotConfig.ULTRA_SCALP_TAKE_PROFIT_PERCENT)
+                stop_loss = current_price * self.sl_mult_short
+                take_profit = current_price * self.tp_mult_short
             else:
                 stop_loss = current_price
                 take_profit = current_price
@@ -103,8 +175,8 @@ class UltraScalpStrategy:
                 'stop_loss': stop_loss,
                 'take_profit': take_profit,
                 'reason': reason,
-                'max_hold_time': BotConfig.ULTRA_SCALP_MAX_HOLD_SECONDS,
-                'target_hold': f'{BotConfig.ULTRA_SCALP_MAX_HOLD_SECONDS // 60} minutes',
+                'max_hold_time': max_hold_seconds,
+                'target_hold': f'{max_hold_seconds // 60} minutes',
                 'rsi': current_rsi,
                 'rsi_slope': rsi_slope,
                 'price_change_1m': price_change_1m,
@@ -116,131 +188,115 @@ class UltraScalpStrategy:
             
     def analyze_and_signal(self, df: pd.DataFrame, symbol: str) -> Dict:
         try:
-            if df.empty or len(df) < BotConfig.MIN_DATA_POINTS:
+            if df.empty or len(df) < self.config.min_data_points:
                 return self._empty_signal('Insufficient data')
     
-            close = df['close']
-            high = df['high']
-            low = df['low']
-            volume = df['volume']
+            # Bind the params snapshot once so the rest of the call uses locals
+            cfg = self.config
+            rsi_period = cfg.rsi_period
+            rsi_buy_threshold = cfg.rsi_buy_threshold
+            rsi_sell_threshold = cfg.rsi_sell_threshold
+            rsi_slope_threshold = cfg.rsi_slope_threshold
+            rsi_distance_divisor = cfg.rsi_distance_divisor
+            momentum_bonus_max = cfg.momentum_bonus_max
+            volume_bonus_value = cfg.volume_bonus_value
+            base_confidence = cfg.base_confidence
+            sl_mult_long = self.sl_mult_long
+            tp_mult_long = self.tp_mult_long
+            sl_mult_short = self.sl_mult_short
+            tp_mult_short = self.tp_mult_short
+            volume_average_period = cfg.volume_average_period
+            volume_surge_threshold = cfg.volume_surge_threshold
+    
+            # Raw column arrays pulled once; everything below indexes these
+            prices = df['close'].values.tolist()
+            vv = df['volume'].values
             
-            # Calculate indicators using config parameters
-            rsi = self._calculate_rsi(close, BotConfig.ULTRA_SCALP_RSI_PERIOD)
-            sma = self._fast_sma(close, BotConfig.ULTRA_SCALP_SMA_PERIOD)
+            # RSI advanced bar by bar on plain floats; no intermediate Series
+            rsi_state = RsiState(rsi_period)
+            rsi = [rsi_state.update(price) for price in prices]
             
-            current_price = float(close.iloc[-1])
-            current_rsi = float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else 50.0
-            current_sma = float(sma.iloc[-1]) if not pd.isna(sma.iloc[-1]) else current_price
+            current_price = prices[-1]
+            current_rsi = rsi[-1]
             
             # RSI Slope calculation using config parameters
             rsi_slope = 0.0
             if len(rsi) >= 3:
-                rsi_prev = float(rsi.iloc[-3]) if not pd.isna(rsi.iloc[-3]) else current_rsi
-                rsi_slope = current_rsi - rsi_prev
+                rsi_slope = current_rsi - rsi[-3]
             
             # Volume momentum using config parameters
-            volume_avg = volume.rolling(BotConfig.VOLUME_AVERAGE_PERIOD).mean().iloc[-1] if len(volume) >= BotConfig.VOLUME_AVERAGE_PERIOD else volume.iloc[-1]
-            volume_surge = float(volume.iloc[-1]) > float(volume_avg) * BotConfig.VOLUME_SURGE_THRESHOLD
+            volume_avg = tail_mean(vv, volume_average_period)
+            volume_surge = float(vv[-1]) > volume_avg * volume_surge_threshold
             
             confidence = 0.0
             action = 'hold'
             reason = 'No signal'
+            # Same for either side; clamps below are conditional expressions
+            # rather than min()/max() calls
+            volume_bonus = volume_bonus_value if volume_surge else 0.0
             
             # BUY SIGNAL using RSI momentum only
-            if (current_rsi < BotConfig.ULTRA_SCALP_RSI_BUY_THRESHOLD and
-                rsi_slope > BotConfig.ULTRA_SCALP_RSI_SLOPE_THRESHOLD):
+            if (current_rsi < rsi_buy_threshold and
+                rsi_slope > rsi_slope_threshold):
                 
                 action = 'buy'
                 
                 # Confidence calculation
-                base_confidence = BotConfig.ULTRA_SCALP_BASE_CONFIDENCE
-                rsi_distance = BotConfig.ULTRA_SCALP_RSI_BUY_THRESHOLD - current_rsi
-                momentum_bonus = min(BotConfig.ULTRA_SCALP_MOMENTUM_BONUS_MAX, 
-                                   max(0, rsi_slope / 10))
-                volume_bonus = BotConfig.ULTRA_SCALP_VOLUME_BONUS if volume_surge else 0.0
+                rsi_distance = rsi_buy_threshold - current_rsi
+                momentum = rsi_slope / 10
+                momentum_bonus = momentum_bonus_max if momentum > momentum_bonus_max else (momentum if momentum > 0 else 0)
                 
-                confidence = min(0.9, base_confidence + (rsi_distance / BotConfig.ULTRA_SCALP_RSI_DISTANCE_DIVISOR) + momentum_bonus + volume_bonus)
+                confidence = base_confidence + (rsi_distance / rsi_distance_divisor) + momentum_bonus + volume_bonus
+                confidence = confidence if confidence < 0.9 else 0.9
                 reason = f'Ultra-scalp BUY: RSI={current_rsi:.1f}(slope:{rsi_slope:.1f})'
                 
             # SELL SIGNAL using RSI momentum only
-            elif (current_rsi > BotConfig.ULTRA_SCALP_RSI_SELL_THRESHOLD and
-                  rsi_slope < -BotConfig.ULTRA_SCALP_RSI_SLOPE_THRESHOLD):
+            elif (current_rsi > rsi_sell_threshold and
+                  rsi_slope < -rsi_slope_threshold):
                 
                 action = 'sell'
                 
                 # Confidence calculation
-                base_confidence = BotConfig.ULTRA_SCALP_BASE_CONFIDENCE
-                rsi_distance = current_rsi - BotConfig.ULTRA_SCALP_RSI_SELL_THRESHOLD
-                momentum_bonus = min(BotConfig.ULTRA_SCALP_MOMENTUM_BONUS_MAX, 
-                                   max(0, abs(rsi_slope) / 10))
-                volume_bonus = BotConfig.ULTRA_SCALP_VOLUME_BONUS if volume_surge else 0.0
+                rsi_distance = current_rsi - rsi_sell_threshold
+                momentum = abs(rsi_slope) / 10
+                momentum_bonus = momentum_bonus_max if momentum > momentum_bonus_max else (momentum if momentum > 0 else 0)
                 
-                confidence = min(0.9, base_confidence + (rsi_distance / BotConfig.ULTRA_SCALP_RSI_DISTANCE_DIVISOR) + momentum_bonus + volume_bonus)
+                confidence = base_confidence + (rsi_distance / rsi_distance_divisor) + momentum_bonus + volume_bonus
+                confidence = confidence if confidence < 0.9 else 0.9
                 reason = f'Ultra-scalp SELL: RSI={current_rsi:.1f}(slope:{rsi_slope:.1f})'
     
             # Set stop loss and take profit using config parameters
             if action == 'buy':
-                stop_loss = current_price * (1 - BotConfig.ULTRA_SCALP_STOP_LOSS_PERCENT)
-                take_profit = current_price * (1 + BotConfig.ULTRA_SCALP_TAKE_PROFIT_PERCENT)
+                stop_loss = current_price * sl_mult_long
+                take_profit = current_price * tp_mult_long
             elif action == 'sell':
-                stop_loss = current_price * (1 + BotConfig.ULTRA_SCALP_STOP_LOSS_PERCENT)
-                take_profit = current_price * (1 - BotConfig.ULTRA_SCALP_TAKE_PROFIT_PERCENT)
+                stop_loss = current_price * sl_mult_short
+                take_profit = current_price * tp_mult_short
             else:
                 stop_loss = current_price
                 take_profit = current_price
     
-            return {
-                'action': action,
-                'confidence': confidence,
-                'strategy': self.name,
-                'entry_price': current_price,
-                'stop_loss': stop_loss,
-                'take_profit': take_profit,
-                'reason': reason,
-                'max_hold_time': BotConfig.ULTRA_SCALP_MAX_HOLD_SECONDS,
-                'target_hold': f'{BotConfig.ULTRA_SCALP_MAX_HOLD_SECONDS // 60} minutes',
-                'rsi': current_rsi,
-                'rsi_slope': rsi_slope,
-                'volume_surge': volume_surge
-            }
+            # Prebuilt hold signal plus the per-tick fields (fresh dict per call)
+            signal = self._empty_template.copy()
+            signal['action'] = action
+            signal['confidence'] = confidence
+            signal['entry_price'] = current_price
+            signal['stop_loss'] = stop_loss
+            signal['take_profit'] = take_profit
+            signal['reason'] = reason
+            signal['rsi'] = current_rsi
+            signal['rsi_slope'] = rsi_slope
+            signal['volume_surge'] = volume_surge
+            return signal
     
         except Exception as e:
             return self._empty_signal(f'Error: {e}')
 
     
-    def _empty_signal(self, reason: str) -> Dict:
-        return {
-            'action': 'hold',
-            'confidence': 0.0,
-            'strategy': self.name,
-            'entry_price': 0,
-            'stop_loss': 0,
-            'take_profit': 0,
-            'reason': reason,
-            'max_hold_time': BotConfig.ULTRA_SCALP_MAX_HOLD_SECONDS,
-            'target_hold': f'{BotConfig.ULTRA_SCALP_MAX_HOLD_SECONDS // 60} minutes'
-        }
-    
-    def _fast_sma(self, data: pd.Series, period: int) -> pd.Series:
+    def _fast_sma(self, data: np.ndarray, period: int) -> np.ndarray:
         """Calculate Simple Moving Average"""
-        return data.rolling(window=period, min_periods=1).mean()
+        return sma_array(data, period)
     
-    def _calculate_rsi(self, data: pd.Series, period: int) -> pd.Series:
-        """Calculate RSI"""
-        try:
-            delta = data.diff()
-            gains = delta.where(delta > 0, 0)
-            losses = -delta.where(delta < 0, 0)
-            
-            avg_gains = gains.ewm(span=period, adjust=False).mean()
-            avg_losses = losses.ewm(span=period, adjust=False).mean()
-            
-            rs = avg_gains / avg_losses
-            rsi = 100 - (100 / (1 + rs))
-            
-            return rsi.fillna(50)
-        except Exception as e:
-            return pd.Series([50] * len(data), index=data.index)
 
 # Export the strategy class
 __all__ = ['UltraScalpStrategy']
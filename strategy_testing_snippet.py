@@ -72,16 +72,16 @@ def test_individual_strategy(strategy_name, market_data, symbol="BTC", verbose=T
     try:
         # Import the strategy
         if strategy_name.lower() == "ultra-scalp":
-            from strategies.ultra_scalp import UltraScalpStrategy
+            from cryptobot.strategies.ultra_scalp import UltraScalpStrategy
             strategy = UltraScalpStrategy()
         elif strategy_name.lower() == "fast-scalp":
-            from strategies.fast_scalp import FastScalpStrategy
+            from cryptobot.strategies.fast_scalp import FastScalpStrategy
             strategy = FastScalpStrategy()
         elif strategy_name.lower() == "quick-momentum":
-            from strategies.quick_momentum import QuickMomentumStrategy
+            from cryptobot.strategies.quick_momentum import QuickMomentumStrategy
             strategy = QuickMomentumStrategy()
         elif strategy_name.lower() == "ttm-squeeze":
-            from strategies.ttm_squeeze import TTMSqueezeStrategy
+            from cryptobot.strategies.ttm_squeeze import TTMSqueezeStrategy
             strategy = TTMSqueezeStrategy()
         else:
             print(f"❌ Unknown strategy: {strategy_name}")
@@ -244,13 +244,14 @@ def analyze_market_conditions(market_data, symbol="BTC"):
         return
     
     # Calculate basic market metrics
-    current_price = df['close'].iloc[-1]
-    price_change_1m = ((current_price / df['close'].iloc[-2]) - 1) * 100 if len(df) > 1 else 0
-    price_change_5m = ((current_price / df['close'].iloc[-6]) - 1) * 100 if len(df) > 5 else 0
-    price_change_10m = ((current_price / df['close'].iloc[-11]) - 1) * 100 if len(df) > 10 else 0
+    cv = df['close'].values
+    current_price = cv[-1]
+    price_change_1m = ((current_price / cv[-2]) - 1) * 100 if len(cv) > 1 else 0
+    price_change_5m = ((current_price / cv[-6]) - 1) * 100 if len(cv) > 5 else 0
+    price_change_10m = ((current_price / cv[-11]) - 1) * 100 if len(cv) > 10 else 0
     
     # Volume analysis
-    current_volume = df['volume'].iloc[-1]
+    current_volume = df['volume'].values[-1]
     avg_volume = df['volume'].rolling(5).mean().iloc[-1]
     volume_surge = current_volume > avg_volume * 1.1
     
@@ -0,0 +1,78 @@
+# tests/test_config.py
+"""BotConfig load/override paths"""
+
+import pytest
+
+from cryptobot.config import BotConfig, get_credentials
+
+
+@pytest.fixture
+def restore_config():
+    """Put back every setting a test changes"""
+    saved = {key: getattr(BotConfig, key) for key in ("INITIAL_BALANCE", "TTM_MAX_HOLD_SECONDS")}
+    yield
+    BotConfig.load(saved)
+
+
+def test_alias_override_sets_source(restore_config):
+    BotConfig.override("TTM_SQUEEZE_MAX_HOLD_SECONDS", 5)
+    assert BotConfig.TTM_MAX_HOLD_SECONDS == 5
+    assert BotConfig.TTM_SQUEEZE_MAX_HOLD_SECONDS == 5
+
+    BotConfig.override("PAPER_INITIAL_BALANCE", 5)
+    assert BotConfig.INITIAL_BALANCE == 5
+    assert BotConfig.PAPER_INITIAL_BALANCE == 5
+
+
+def test_alias_conflicting_with_source_is_rejected(restore_config):
+    balance = BotConfig.INITIAL_BALANCE
+    with pytest.raises(ValueError, match="INITIAL_BALANCE"):
+        BotConfig.load({"INITIAL_BALANCE": 1, "PAPER_INITIAL_BALANCE": 2})
+    assert BotConfig.INITIAL_BALANCE == balance
+
+
+def test_with_overrides_accepts_alias():
+    copy = BotConfig.with_overrides(TTM_SQUEEZE_MAX_HOLD_SECONDS=7)
+    assert copy.TTM_MAX_HOLD_SECONDS == 7
+    assert copy.TTM_SQUEEZE_MAX_HOLD_SECONDS == 7
+
+
+def test_refresh_rereads_credentials_from_environment(monkeypatch):
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "aaa")
+    BotConfig.refresh()
+    assert BotConfig.TELEGRAM_BOT_TOKEN == "aaa"
+
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "bbb")
+    BotConfig.refresh()
+    assert BotConfig.TELEGRAM_BOT_TOKEN == "bbb"
+
+    monkeypatch.delenv("TELEGRAM_BOT_TOKEN")
+    BotConfig.refresh()
+    assert BotConfig.TELEGRAM_BOT_TOKEN == BotConfig.__lazy_settings__["TELEGRAM_BOT_TOKEN"]
+
+
+def test_get_credentials_follows_refresh(monkeypatch):
+    monkeypatch.setenv("TELEGRAM_CHAT_ID", "aaa")
+    BotConfig.refresh()
+    assert get_credentials()["TELEGRAM_CHAT_ID"] == "aaa"
+
+    monkeypatch.setenv("TELEGRAM_CHAT_ID", "bbb")
+    BotConfig.refresh()
+    assert get_credentials()["TELEGRAM_CHAT_ID"] == "bbb"
+
+    monkeypatch.delenv("TELEGRAM_CHAT_ID")
+    BotConfig.refresh()
+
+
+def test_with_overrides_copy_cannot_change_live_config():
+    confidence = BotConfig.MIN_CONFIDENCE
+    copy = BotConfig.with_overrides(MIN_CONFIDENCE=0.9)
+    for change in (
+        lambda: copy.override("MIN_CONFIDENCE", 0.77),
+        lambda: copy.load({"MIN_CONFIDENCE": 0.77}),
+        lambda: copy.refresh(),
+    ):
+        with pytest.raises(TypeError):
+            change()
+    assert copy.MIN_CONFIDENCE == 0.9
+    assert BotConfig.MIN_CONFIDENCE == confidence
@@ -0,0 +1,82 @@
+# tests/test_gcp_scan.py
+"""GCP window-scan kernels against the per-window numpy scoring they replaced"""
+
+import numpy as np
+import pytest
+
+from cryptobot.utils.ta import gcp_growth_scan, gcp_plateau_scan
+
+VOLATILITY_THRESHOLD = 0.02
+DRIFT_THRESHOLD = 0.5
+
+
+def reference_growth_score(prices):
+    """Growth consistency score (formerly PureGCPDetector._calculate_growth_score)"""
+    if len(prices) < 3:
+        return 0.0
+    price_changes = np.diff(prices)
+    consistency = np.mean(price_changes > 0) if np.mean(price_changes) > 0 else np.mean(price_changes < 0)
+    return max(consistency, 1 - consistency)
+
+
+def reference_plateau_score(prices):
+    """Plateau stability score (formerly PureGCPDetector._calculate_plateau_score)"""
+    if len(prices) < 3 or np.mean(prices) == 0:
+        return 0.0
+    volatility = np.std(prices) / np.mean(prices)
+    linear_slope = np.polyfit(np.arange(len(prices)), prices, 1)[0]
+    drift_percentage_per_period = (linear_slope / np.mean(prices)) * 100
+    volatility_score = max(0, 1 - (volatility / VOLATILITY_THRESHOLD))
+    drift_score = max(0, 1 - (abs(drift_percentage_per_period) / DRIFT_THRESHOLD))
+    return (volatility_score * 0.6) + (drift_score * 0.4)
+
+
+def reference_growth_scan(prices, min_growth, consistency_threshold, max_window):
+    best = (0.0, 0.0, 0)
+    for window in range(5, min(len(prices), max_window) + 1):
+        segment = prices[-window:]
+        growth = (segment[-1] - segment[0]) / segment[0] * 100
+        score = reference_growth_score(segment)
+        if abs(growth) >= min_growth and score >= consistency_threshold and abs(growth) > abs(best[0]):
+            best = (growth, score, window)
+    return best
+
+
+def random_walks(count, length=30, seed=7):
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0, 0.004, size=(count, length))
+    # Some flat stretches so plateau ties actually occur
+    steps[rng.random(size=steps.shape) < 0.3] = 0.0
+    return 100 * np.cumprod(1 + steps, axis=1)
+
+
+@pytest.mark.parametrize("prices", list(random_walks(200)))
+def test_growth_scan_matches_reference(prices):
+    growth, score, window = gcp_growth_scan(prices, 0.3, 0.6, 20)
+    ref_growth, ref_score, ref_window = reference_growth_scan(prices, 0.3, 0.6, 20)
+    assert window == ref_window
+    assert growth == pytest.approx(ref_growth, abs=1e-9)
+    assert score == pytest.approx(ref_score, abs=1e-12)
+
+
+@pytest.mark.parametrize("prices", list(random_walks(200)))
+def test_plateau_scan_scores_match_reference(prices):
+    score, window = gcp_plateau_scan(prices, VOLATILITY_THRESHOLD, DRIFT_THRESHOLD, 4, 20)
+    if window:
+        # The closed-form slope only differs from polyfit by rounding
+        assert score == pytest.approx(reference_plateau_score(prices[-window:]), abs=1e-9)
+        assert score >= 0.25
+    else:
+        assert score == 0.0
+
+
+def test_plateau_scan_tie_keeps_shortest_window():
+    # Every window of a flat series scores exactly 1.0; the shortest one wins
+    prices = np.full(20, 100.0)
+    assert gcp_plateau_scan(prices, VOLATILITY_THRESHOLD, DRIFT_THRESHOLD, 4, 20) == (1.0, 4)
+    assert gcp_plateau_scan(prices, VOLATILITY_THRESHOLD, DRIFT_THRESHOLD, 6, 20) == (1.0, 6)
+
+
+def test_plateau_scan_needs_min_duration():
+    prices = np.full(5, 100.0)
+    assert gcp_plateau_scan(prices, VOLATILITY_THRESHOLD, DRIFT_THRESHOLD, 8, 20) == (0.0, 0)
@@ -0,0 +1,32 @@
+# tests/test_ta.py
+"""EMA helpers against pandas ewm(adjust=False)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cryptobot.utils.ta import EmaState, TechnicalAnalysis, ema_array
+
+NAN = np.nan
+
+
+@pytest.mark.parametrize("values", [
+    [1, 2, 3, NAN, 5, 6, 7],
+    [1, 2, 3, NAN, NAN, 5, 6, 7],
+    [NAN, NAN, 3, NAN, 5, 5, NAN],
+    [4, 4, NAN, 4, 5],
+])
+@pytest.mark.parametrize("span", [2, 3, 5, 12])
+def test_ema_matches_pandas_with_nan(values, span):
+    values = np.array(values, dtype=np.float64)
+    expected = pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+    np.testing.assert_array_equal(ema_array(values, span), expected)
+    np.testing.assert_array_equal(TechnicalAnalysis.fast_ema(pd.Series(values), span).to_numpy(), expected)
+
+    state = EmaState(span)
+    np.testing.assert_array_equal([state.update(x) for x in values], expected)
+
+
+def test_ema_nan_keeps_previous_value():
+    values = np.array([1, 2, 3, NAN, 5, 6, 7], dtype=np.float64)
+    np.testing.assert_array_equal(ema_array(values, 3), [1.0, 1.5, 2.25, 2.25, 4.3125, 5.15625, 6.078125])
@@ -10,7 +10,7 @@ from typing import Dict, List
 
 # Local imports
 from cryptobot.utils.wallet import validate_private_key
-from cryptobot.config import BotConfig
+from cryptobot.config import BotConfig, get_credentials
 from cryptobot.strategies import UltraScalpStrategy, FastScalpStrategy, QuickMomentumStrategy, TTMSqueezeStrategy
 from cryptobot.strategies.signal_aggregator import SignalAggregator
 from cryptobot.utils.exchange import ExchangeInterface
@@ -32,7 +32,7 @@ GLOBAL_BOT_STATE = {
 class TradingEngine:
     def __init__(self):
         self.config = BotConfig
-        self.private_key = BotConfig.HYPERLIQUID_PRIVATE_KEY
+        self.private_key = get_credentials()["HYPERLIQUID_PRIVATE_KEY"]
         self.wallet = validate_private_key(self.private_key)
         self.exchange = ExchangeInterface(mode=BotConfig.MODE, private_key=self.private_key)
         self.portfolio = Portfolio()
@@ -205,47 +205,72 @@ class TradingEngine:
                 logger.warning(f"⚠️ Failed to get 1m data for {symbol}: {e}")
         return market_data
 
+    def _time_limit_hits(self, positions: List[Dict], current_time: datetime) -> np.ndarray:
+        """Flag every position past its max hold time in one vectorized sweep"""
+        if not positions:
+            return np.zeros(0, dtype=bool)
+        
+        # Each position keeps the hold time it was opened with (default 30 minutes)
+        max_hold = np.array([p.get('max_hold_time', 1800) for p in positions], dtype=np.float64)
+        elapsed = np.array([
+            (current_time - datetime.fromisoformat(p['entry_time'])).total_seconds()
+            if p.get('entry_time') else -np.inf
+            for p in positions
+        ])
+        return elapsed >= max_hold
+
+    def _price_level_hits(self, positions: List[Dict], prices: np.ndarray):
+        """Flag stop loss and take profit hits for every position in one vectorized sweep"""
+        if not positions:
+            empty = np.zeros(0, dtype=bool)
+            return empty, empty
+        
+        # Positions without a stop/target level get NaN, which never compares true
+        stops = np.array([p.get('stop_loss') or np.nan for p in positions], dtype=np.float64)
+        targets = np.array([p.get('take_profit') or np.nan for p in positions], dtype=np.float64)
+        sides = [p.get('side') for p in positions]
+        is_buy = np.array([side == 'buy' for side in sides])
+        is_sell = np.array([side == 'sell' for side in sides])
+        
+        stop_hits = (is_buy & (prices <= stops)) | (is_sell & (prices >= stops))
+        target_hits = (is_buy & (prices >= targets)) | (is_sell & (prices <= targets))
+        return stop_hits, target_hits
+
     def _check_position_exits(self, market_data: Dict):
         """Check all open positions for exit conditions (stop loss, take profit, time limit)"""
         current_time = datetime.now()
+        open_positions = list(self.portfolio.positions.items())
+        positions = [position for _, position in open_positions]
+        prices = np.array([
+            market_data.get(symbol, position.get('entry_price', 0))
+            for (symbol, _), position in open_positions
+        ], dtype=np.float64)
+        stop_hits, target_hits = self._price_level_hits(positions, prices)
+        time_hits = self._time_limit_hits(positions, current_time)
         
-        for (symbol, strategy), position in list(self.portfolio.positions.items()):
+        for i, ((symbol, strategy), position) in enumerate(open_positions):
             current_price = market_data.get(symbol, position.get('entry_price', 0))
             if current_price <= 0:
                 continue
                 
             # Check stop loss
-            if position.get('stop_loss'):
-                if position['side'] == 'buy' and current_price <= position['stop_loss']:
-                    logger.info(f"🛑 {symbol} ({strategy}): Stop loss hit at ${current_price:.2f}")
-                    self._close_position_with_telegram(symbol, strategy, current_price, 'stop_loss')
-                    continue
-                elif position['side'] == 'sell' and current_price >= position['stop_loss']:
-                    logger.info(f"🛑 {symbol} ({strategy}): Stop loss hit at ${current_price:.2f}")
-                    self._close_position_with_telegram(symbol, strategy, current_price, 'stop_loss')
-                    continue
+            if stop_hits[i]:
+                logger.info(f"🛑 {symbol} ({strategy}): Stop loss hit at ${current_price:.2f}")
+                self._close_position_with_telegram(symbol, strategy, current_price, 'stop_loss')
+                continue
             
             # Check take profit
-            if position.get('take_profit'):
-                if position['side'] == 'buy' and current_price >= position['take_profit']:
-                    logger.info(f"💰 {symbol} ({strategy}): Take profit hit at ${current_price:.2f}")
-                    self._close_position_with_telegram(symbol, strategy, current_price, 'take_profit')
-                    continue
-                elif position['side'] == 'sell' and current_price <= position['take_profit']:
-                    logger.info(f"💰 {symbol} ({strategy}): Take profit hit at ${current_price:.2f}")
-                    self._close_position_with_telegram(symbol, strategy, current_price, 'take_profit')
-                    continue
+            if target_hits[i]:
+                logger.info(f"💰 {symbol} ({strategy}): Take profit hit at ${current_price:.2f}")
+                self._close_position_with_telegram(symbol, strategy, current_price, 'take_profit')
+                continue
             
             # Check time limit
-            if position.get('entry_time'):
-                entry_time = datetime.fromisoformat(position['entry_time'])
-                max_hold_seconds = position.get('max_hold_time', 1800)  # Default 30 minutes
-                elapsed_seconds = (current_time - entry_time).total_seconds()
-                
-                if elapsed_seconds >= max_hold_seconds:
-                    logger.info(f"⏰ {symbol} ({strategy}): Time limit reached ({elapsed_seconds:.0f}s)")
-                    self._close_position_with_telegram(symbol, strategy, current_price, 'time_limit')
-                    continue
+            if time_hits[i]:
+                elapsed_seconds = (current_time - datetime.fromisoformat(position['entry_time'])).total_seconds()
+                logger.info(f"⏰ {symbol} ({strategy}): Time limit reached ({elapsed_seconds:.0f}s)")
+                self._close_position_with_telegram(symbol, strategy, current_price, 'time_limit')
+                continue
 
     def _close_position_with_telegram(self, symbol: str, strategy: str, current_price: float, reason: str):
         """Close a position and send Telegram notification"""
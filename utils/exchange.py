@@ -3,14 +3,13 @@
 from hyperliquid.info import Info as HLInfo
 from hyperliquid.exchange import Exchange as HLExchange
 from hyperliquid.utils import constants
-from utils.wallet import validate_private_key
 from typing import Dict, Any, Optional
 import pandas as pd
 import numpy as np
 import random
 import time
 from datetime import datetime, timedelta
-from cryptobot.config import BotConfig
+from cryptobot.config import BotConfig, Mode
 import eth_account
 from eth_account.signers.local import LocalAccount
 
@@ -34,6 +33,11 @@ def validate_private_key(private_key: str) -> Optional[LocalAccount]:
 class ExchangeInterface:
     def __init__(self, mode: str = 'live', private_key: Optional[str] = None):
         self.mode = mode
+        self.mode_id = Mode[mode.upper()] if isinstance(mode, str) else Mode(mode)
+        # Per-mode handlers indexed by Mode, resolved once instead of comparing strings per call
+        self._market_data_handlers = (self._fetch_market_data, self._fetch_market_data, self._simulate_market_data)
+        self._candles_handlers = (self._fetch_candles_df, self._fetch_candles_df, self._simulate_candles_df)
+        self._order_handlers = (self._submit_order, self._submit_order, self._simulate_order)
         self.symbols = BotConfig.TRADING_SYMBOLS
         self.private_key = private_key
         self.hyperliquid_info = None
@@ -43,7 +47,7 @@ class ExchangeInterface:
         self.wallet = None
 
     def _initialize_client(self):
-        testnet = (self.mode == 'paper')
+        testnet = (self.mode_id == Mode.PAPER)
         base_url = constants.TESTNET_API_URL if testnet else constants.MAINNET_API_URL
 
         try:
@@ -62,87 +66,102 @@ class ExchangeInterface:
             
     def get_market_data(self) -> Dict[str, float]:
         """Get current mid prices for all symbols"""
-        if self.mode in ['paper', 'live']:
-            try:
-                mids = self.hyperliquid_info.all_mids()
-                return {s: float(mids[s]) for s in self.symbols if s in mids}
-            except Exception as e:
-                print(f"❌ Failed to fetch market data: {e}")
-                return {}
-        elif self.mode == 'backtest':
-            return {
-                symbol: np.random.uniform(*self._get_price_range(symbol))
-                for symbol in self.symbols
-            }
+        return self._market_data_handlers[self.mode_id]()
+
+    def _fetch_market_data(self) -> Dict[str, float]:
+        """Paper/live: mid prices from Hyperliquid"""
+        try:
+            mids = self.hyperliquid_info.all_mids()
+            return {s: float(mids[s]) for s in self.symbols if s in mids}
+        except Exception as e:
+            print(f"❌ Failed to fetch market data: {e}")
+            return {}
+
+    def _simulate_market_data(self) -> Dict[str, float]:
+        """Backtest: random prices inside each symbol's range"""
+        return {
+            symbol: np.random.uniform(*self._get_price_range(symbol))
+            for symbol in self.symbols
+        }
 
     def get_candles_df(self, symbol: str, interval: str = '1m', lookback: int = 30) -> pd.DataFrame:
         """Fetch OHLCV data from Hyperliquid or simulate if unavailable"""
-        if self.mode in ['paper', 'live']:
-            try:
-                # Map to Hyperliquid interval format
-                interval_map = {
-                    '1m': '1m',
-                    '5m': '5m',
-                    '15m': '15m',
-                    '1h': '1h',
-                    '4h': '4h',
-                    '1d': '1d'
+        return self._candles_handlers[self.mode_id](symbol, interval, lookback)
+
+    def _fetch_candles_df(self, symbol: str, interval: str = '1m', lookback: int = 30) -> pd.DataFrame:
+        """Paper/live: OHLCV candles from Hyperliquid"""
+        try:
+            # Map to Hyperliquid interval format
+            interval_map = {
+                '1m': '1m',
+                '5m': '5m',
+                '15m': '15m',
+                '1h': '1h',
+                '4h': '4h',
+                '1d': '1d'
+            }
+            hl_interval = interval_map.get(interval, '1m')
+
+            # Calculate time range for candles
+            end_time = int(time.time() * 1000)  # Current time in milliseconds
+            start_time = end_time - (lookback * 60 * 1000)  # lookback minutes ago
+            
+            # Fetch candles using correct SDK syntax with time parameters
+            candles = self.hyperliquid_info.candles_snapshot(symbol, hl_interval, start_time, end_time)
+            df = pd.DataFrame(candles)
+
+            # Check if DataFrame has expected columns
+            if not df.empty:
+                # Rename columns if they exist
+                column_mapping = {
+                    'T': 'timestamp',
+                    'o': 'open',
+                    'h': 'high',
+                    'l': 'low',
+                    'c': 'close',
+                    'v': 'volume'
                 }
-                hl_interval = interval_map.get(interval, '1m')
-    
-                # Calculate time range for candles
-                end_time = int(time.time() * 1000)  # Current time in milliseconds
-                start_time = end_time - (lookback * 60 * 1000)  # lookback minutes ago
                 
-                # Fetch candles using correct SDK syntax with time parameters
-                candles = self.hyperliquid_info.candles_snapshot(symbol, hl_interval, start_time, end_time)
-                df = pd.DataFrame(candles)
-    
-                # Check if DataFrame has expected columns
-                if not df.empty:
-                    # Rename columns if they exist
-                    column_mapping = {
-                        'T': 'timestamp',
-                        'o': 'open',
-                        'h': 'high',
-                        'l': 'low',
-                        'c': 'close',
-                        'v': 'volume'
-                    }
-                    
-                    # Only rename columns that exist
-                    existing_columns = df.columns.tolist()
-                    rename_dict = {k: v for k, v in column_mapping.items() if k in existing_columns}
-                    if rename_dict:
-                        df.rename(columns=rename_dict, inplace=True)
-                    
-                    # Ensure required columns exist
-                    required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-                    missing_columns = [col for col in required_columns if col not in df.columns]
-                    
-                    if missing_columns:
-                        print(f"⚠️ Missing columns: {missing_columns}")
-                        return self._generate_fallback_candles(symbol, lookback)
-                    
-                    # Convert timestamp to datetime
-                    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                    df[['open', 'high', 'low', 'close', 'volume']] = df[['open', 'high', 'low', 'close', 'volume']].astype(float)
-                else:
-                    print(f"⚠️ Empty DataFrame for {symbol}")
+                # Only rename columns that exist
+                existing_columns = df.columns.tolist()
+                rename_dict = {k: v for k, v in column_mapping.items() if k in existing_columns}
+                if rename_dict:
+                    df.rename(columns=rename_dict, inplace=True)
+                
+                # Ensure required columns exist
+                required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+                missing_columns = [col for col in required_columns if col not in df.columns]
+                
+                if missing_columns:
+                    print(f"⚠️ Missing columns: {missing_columns}")
                     return self._generate_fallback_candles(symbol, lookback)
-                return df.sort_values('timestamp').reset_index(drop=True)
-            except Exception as e:
-                print(f"❌ Error fetching real candles: {e}")
+                
+                # Convert timestamp to datetime
+                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+                df[['open', 'high', 'low', 'close', 'volume']] = df[['open', 'high', 'low', 'close', 'volume']].astype(float)
+            else:
+                print(f"⚠️ Empty DataFrame for {symbol}")
                 return self._generate_fallback_candles(symbol, lookback)
-        elif self.mode == 'backtest':
+            return df.sort_values('timestamp').reset_index(drop=True)
+        except Exception as e:
+            print(f"❌ Error fetching real candles: {e}")
             return self._generate_fallback_candles(symbol, lookback)
 
+    def _simulate_candles_df(self, symbol: str, interval: str = '1m', lookback: int = 30) -> pd.DataFrame:
+        """Backtest: simulated candles (interval is ignored)"""
+        return self._generate_fallback_candles(symbol, lookback)
+
     def place_order(self, symbol: str, action: str, size: float, reduce_only: bool = False) -> Optional[Dict]:
         """Place market order via Hyperliquid"""
-        if self.mode == 'backtest':
-            print(f"[Backtest] Would have placed {action} order for {symbol} x {size}")
-            return {"status": "simulated", "action": action, "size": size}
+        return self._order_handlers[self.mode_id](symbol, action, size, reduce_only)
+
+    def _simulate_order(self, symbol: str, action: str, size: float, reduce_only: bool = False) -> Dict:
+        """Backtest: report the order without sending it"""
+        print(f"[Backtest] Would have placed {action} order for {symbol} x {size}")
+        return {"status": "simulated", "action": action, "size": size}
 
+    def _submit_order(self, symbol: str, action: str, size: float, reduce_only: bool = False) -> Optional[Dict]:
+        """Paper/live: submit a market order to Hyperliquid"""
         if not self.hyperliquid_exchange:
             print("❌ Exchange not initialized – missing private key?")
             return None
@@ -2,7 +2,8 @@
 import logging
 from typing import Dict, Any, Tuple
 from datetime import datetime, timedelta
-from config import BotConfig
+from cryptobot import config as bot_config
+from cryptobot.config import BotConfig
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,13 @@ class Position:
             self.unrealized_pnl = (self.entry_price - current_price) * self.size
 
 class Portfolio:
+    # Global sizing overrides set via update_global_sizing(); None follows BotConfig
+    dynamic_position_size_percent = None
+    dynamic_min_position_value = None
+    dynamic_max_position_value = None
+    dynamic_target_position_value = None
+    _global_sizing_info = None  # (config snapshot, info) built by get_global_sizing_info()
+
     def __init__(self):
         self.balance = BotConfig.INITIAL_BALANCE
         self.positions = {}  # (symbol, strategy) -> position dict
@@ -108,17 +116,24 @@ class Portfolio:
             cls.dynamic_target_position_value = target_position_value
             print(f"💰 Updated global target position value: ${target_position_value:,.2f}")
         
+        cls._global_sizing_info = None
         print(f"✅ Global position sizing updated successfully!")
     
     @classmethod
     def get_global_sizing_info(cls) -> Dict[str, float]:
-        """Get current global position sizing parameters"""
-        return {
-            'position_size_percent': getattr(cls, 'dynamic_position_size_percent', 25.0),
-            'min_position_value': getattr(cls, 'dynamic_min_position_value', 1000.0),
-            'max_position_value': getattr(cls, 'dynamic_max_position_value', 3500.0),
-            'target_position_value': getattr(cls, 'dynamic_target_position_value', 2500.0)
-        }
+        """Get current global position sizing parameters (cached until the next update or config reload)"""
+        cached = cls._global_sizing_info
+        # CFG_VALS is rebuilt on every BotConfig.load()/override(), so a new snapshot means stale info
+        if cached is None or cached[0] is not bot_config.CFG_VALS:
+            info = {
+                'position_size_percent': BotConfig.POSITION_SIZE_PERCENT if cls.dynamic_position_size_percent is None else cls.dynamic_position_size_percent,
+                'min_position_value': BotConfig.MIN_POSITION_VALUE if cls.dynamic_min_position_value is None else cls.dynamic_min_position_value,
+                'max_position_value': BotConfig.MAX_POSITION_VALUE if cls.dynamic_max_position_value is None else cls.dynamic_max_position_value,
+                'target_position_value': BotConfig.TARGET_POSITION_VALUE if cls.dynamic_target_position_value is None else cls.dynamic_target_position_value
+            }
+            cached = cls._global_sizing_info = (bot_config.CFG_VALS, info)
+        # Hand out a copy so callers can't mutate the shared cache
+        return dict(cached[1])
     
     def has_position(self, symbol: str) -> bool:
         """Check if we have ANY position for a symbol (for backward compatibility)"""
@@ -298,6 +313,7 @@ class Portfolio:
                 'entry_price': price,
                 'strategy': strategy,
                 'entry_time': datetime.now().isoformat(),
+                'max_hold_time': signal.get('max_hold_time', 1800),
                 'stop_loss': signal.get('stop_loss'),
                 'take_profit': signal.get('take_profit')
             }
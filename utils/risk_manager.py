@@ -4,11 +4,16 @@ Allows real-time adjustment of risk parameters while bot runs
 """
 
 import logging
+import threading
 from typing import Dict, Any
-from cryptobot.config import BotConfig
+from cryptobot.config import BotConfig, STRAT_ULTRA, STRAT_FAST, STRAT_QM, STRAT_TTM
 
 logger = logging.getLogger(__name__)
 
+# _log_current_settings() report, written as a single log record
+_SETTINGS_TEMPLATE = "📊 Current Risk Settings:\n   Global SL: {sl}%\n   Global TP: {tp}%\n{strategies}"
+_STRATEGY_LINE = "   {name}: SL {sl}%, TP {tp}%".format
+
 class DynamicRiskManager:
     """
     Manages dynamic stop loss and take profit levels
@@ -22,34 +27,166 @@ class DynamicRiskManager:
         
         # Strategy-specific dynamic settings
         self.strategy_sl_tp = {
-            "Ultra-Scalp": {
+            STRAT_ULTRA: {
                 "stop_loss": BotConfig.DYNAMIC_ULTRA_SCALP_SL,
                 "take_profit": BotConfig.DYNAMIC_ULTRA_SCALP_TP
             },
-            "Fast-Scalp": {
+            STRAT_FAST: {
                 "stop_loss": BotConfig.DYNAMIC_FAST_SCALP_SL,
                 "take_profit": BotConfig.DYNAMIC_FAST_SCALP_TP
             },
-            "Quick-Momentum": {
+            STRAT_QM: {
                 "stop_loss": BotConfig.DYNAMIC_QUICK_MOMENTUM_SL,
                 "take_profit": BotConfig.DYNAMIC_QUICK_MOMENTUM_TP
             },
-            "TTM-Squeeze": {
+            STRAT_TTM: {
                 "stop_loss": BotConfig.DYNAMIC_TTM_SQUEEZE_SL,
                 "take_profit": BotConfig.DYNAMIC_TTM_SQUEEZE_TP
             }
         }
         
+        # Settings above as price ratios (percent / 100), see _rebuild_ratios()
+        self._global_ratios = (0.0, 0.0)
+        self._strategy_ratios: Dict[str, tuple] = {}
+        self._rebuild_ratios()
+        
+        # Pending (not yet applied) updates, see queue_update()
+        self._pending: Dict[str, Any] = {}
+        self._pending_count = 0
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+        # Held while a batch is taken and applied, so flushes from the timer thread
+        # and the caller land in order and never interleave _rebuild_ratios()
+        self._apply_lock = threading.Lock()
+        
         logger.info("🛡️ Dynamic Risk Manager initialized")
         self._log_current_settings()
     
+    def _rebuild_ratios(self):
+        """Convert the current percent settings to ratios once per change, not per call"""
+        self._global_ratios = (
+            self.dynamic_stop_loss_percent / 100,
+            self.dynamic_take_profit_percent / 100
+        )
+        self._strategy_ratios = {
+            strategy: (settings["stop_loss"] / 100, settings["take_profit"] / 100)
+            for strategy, settings in self.strategy_sl_tp.items()
+        }
+    
     def _log_current_settings(self):
-        """Log current risk settings"""
-        logger.info("📊 Current Risk Settings:")
-        logger.info(f"   Global SL: {self.dynamic_stop_loss_percent}%")
-        logger.info(f"   Global TP: {self.dynamic_take_profit_percent}%")
-        for strategy, settings in self.strategy_sl_tp.items():
-            logger.info(f"   {strategy}: SL {settings['stop_loss']}%, TP {settings['take_profit']}%")
+        """Log current risk settings (skipped entirely unless INFO is enabled)"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(_SETTINGS_TEMPLATE.format(
+            sl=self.dynamic_stop_loss_percent,
+            tp=self.dynamic_take_profit_percent,
+            strategies="\n".join(
+                _STRATEGY_LINE(name=strategy, sl=settings['stop_loss'], tp=settings['take_profit'])
+                for strategy, settings in self.strategy_sl_tp.items()
+            )
+        ))
+    
+    def bulk_update(self, payload: Dict[str, Any]) -> bool:
+        """
+        Apply global and per-strategy risk changes in a single pass
+
+        payload = {
+            "global": {"stop_loss": 0.3, "take_profit": 0.6},
+            "strategies": {"Ultra-Scalp": {"stop_loss": 0.15, "take_profit": 0.30}, ...}
+        }
+        Returns False if any strategy in the payload is unknown
+        """
+        with self._apply_lock:
+            return self._apply(payload)
+    
+    def _apply(self, payload: Dict[str, Any]) -> bool:
+        """bulk_update() body; the caller holds _apply_lock"""
+        all_found = True
+        
+        global_update = payload.get("global")
+        if global_update:
+            stop_loss_percent = global_update.get("stop_loss")
+            take_profit_percent = global_update.get("take_profit")
+            
+            if stop_loss_percent is not None:
+                self.dynamic_stop_loss_percent = stop_loss_percent
+                logger.info(f"🛡️ Updated global stop loss: {stop_loss_percent}%")
+            
+            if take_profit_percent is not None:
+                self.dynamic_take_profit_percent = take_profit_percent
+                logger.info(f"💰 Updated global take profit: {take_profit_percent}%")
+            
+            logger.info("✅ Global risk settings updated")
+        
+        for strategy_name, strategy_update in payload.get("strategies", {}).items():
+            if strategy_name not in self.strategy_sl_tp:
+                logger.error(f"❌ Strategy '{strategy_name}' not found")
+                all_found = False
+                continue
+            
+            stop_loss_percent = strategy_update.get("stop_loss")
+            take_profit_percent = strategy_update.get("take_profit")
+            
+            if stop_loss_percent is not None:
+                self.strategy_sl_tp[strategy_name]["stop_loss"] = stop_loss_percent
+                logger.info(f"🛡️ Updated {strategy_name} stop loss: {stop_loss_percent}%")
+            
+            if take_profit_percent is not None:
+                self.strategy_sl_tp[strategy_name]["take_profit"] = take_profit_percent
+                logger.info(f"💰 Updated {strategy_name} take profit: {take_profit_percent}%")
+            
+            logger.info(f"✅ {strategy_name} risk settings updated")
+        
+        self._rebuild_ratios()
+        return all_found
+    
+    @staticmethod
+    def _merge_update(target: Dict[str, Any], update: Dict[str, Any]):
+        """Fold a stop_loss/take_profit update into target, skipping None values"""
+        for field in ("stop_loss", "take_profit"):
+            if update.get(field) is not None:
+                target[field] = update[field]
+    
+    def queue_update(self, payload: Dict[str, Any]):
+        """
+        Add a bulk_update() payload to the pending batch
+        The batch is applied once no new update arrives for RISK_WRITE_BATCH_TIMEOUT_MS,
+        when RISK_WRITE_BATCH_MAX updates are pending, or on flush()
+        """
+        with self._pending_lock:
+            if payload.get("global"):
+                self._merge_update(self._pending.setdefault("global", {}), payload["global"])
+            for strategy_name, strategy_update in payload.get("strategies", {}).items():
+                strategies = self._pending.setdefault("strategies", {})
+                self._merge_update(strategies.setdefault(strategy_name, {}), strategy_update)
+            self._pending_count += 1
+            
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            flush_now = self._pending_count >= BotConfig.RISK_WRITE_BATCH_MAX
+            if not flush_now:
+                self._flush_timer = threading.Timer(BotConfig.RISK_WRITE_BATCH_TIMEOUT_MS / 1000, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        if flush_now:
+            self.flush()
+    
+    def flush(self) -> bool:
+        """Apply all pending updates now in a single bulk_update()"""
+        with self._apply_lock:
+            with self._pending_lock:
+                payload, self._pending = self._pending, {}
+                self._pending_count = 0
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            
+            if not payload:
+                return True
+            return self._apply(payload)
     
     def update_global_risk(self, 
                           stop_loss_percent: float = None,
@@ -57,15 +194,9 @@ class DynamicRiskManager:
         """
         Update global stop loss and take profit percentages
         """
-        if stop_loss_percent is not None:
-            self.dynamic_stop_loss_percent = stop_loss_percent
-            logger.info(f"🛡️ Updated global stop loss: {stop_loss_percent}%")
-        
-        if take_profit_percent is not None:
-            self.dynamic_take_profit_percent = take_profit_percent
-            logger.info(f"💰 Updated global take profit: {take_profit_percent}%")
-        
-        logger.info("✅ Global risk settings updated")
+        self.bulk_update({
+            "global": {"stop_loss": stop_loss_percent, "take_profit": take_profit_percent}
+        })
     
     def update_strategy_risk(self, 
                            strategy_name: str,
@@ -74,20 +205,11 @@ class DynamicRiskManager:
         """
         Update risk settings for a specific strategy
         """
-        if strategy_name not in self.strategy_sl_tp:
-            logger.error(f"❌ Strategy '{strategy_name}' not found")
-            return False
-        
-        if stop_loss_percent is not None:
-            self.strategy_sl_tp[strategy_name]["stop_loss"] = stop_loss_percent
-            logger.info(f"🛡️ Updated {strategy_name} stop loss: {stop_loss_percent}%")
-        
-        if take_profit_percent is not None:
-            self.strategy_sl_tp[strategy_name]["take_profit"] = take_profit_percent
-            logger.info(f"💰 Updated {strategy_name} take profit: {take_profit_percent}%")
-        
-        logger.info(f"✅ {strategy_name} risk settings updated")
-        return True
+        return self.bulk_update({
+            "strategies": {
+                strategy_name: {"stop_loss": stop_loss_percent, "take_profit": take_profit_percent}
+            }
+        })
     
     def update_all_strategies_risk(self,
                                  stop_loss_percent: float = None,
@@ -95,8 +217,12 @@ class DynamicRiskManager:
         """
         Update risk settings for all strategies at once
         """
-        for strategy_name in self.strategy_sl_tp.keys():
-            self.update_strategy_risk(strategy_name, stop_loss_percent, take_profit_percent)
+        self.bulk_update({
+            "strategies": {
+                strategy_name: {"stop_loss": stop_loss_percent, "take_profit": take_profit_percent}
+                for strategy_name in self.strategy_sl_tp
+            }
+        })
         
         logger.info("✅ All strategy risk settings updated")
     
@@ -104,6 +230,9 @@ class DynamicRiskManager:
         """
         Get current risk settings
         """
+        if self._pending:
+            self.flush()
+        
         if strategy_name:
             if strategy_name not in self.strategy_sl_tp:
                 return {}
@@ -128,20 +257,18 @@ class DynamicRiskManager:
         """
         Calculate stop loss and take profit levels for a strategy
         """
-        if strategy_name not in self.strategy_sl_tp:
-            # Use global settings as fallback
-            sl_percent = self.dynamic_stop_loss_percent
-            tp_percent = self.dynamic_take_profit_percent
-        else:
-            sl_percent = self.strategy_sl_tp[strategy_name]["stop_loss"]
-            tp_percent = self.strategy_sl_tp[strategy_name]["take_profit"]
+        if self._pending:
+            self.flush()
+        
+        # Use global settings as fallback
+        sl_ratio, tp_ratio = self._strategy_ratios.get(strategy_name, self._global_ratios)
         
         if action == "buy":
-            stop_loss = current_price * (1 - sl_percent / 100)
-            take_profit = current_price * (1 + tp_percent / 100)
+            stop_loss = current_price * (1 - sl_ratio)
+            take_profit = current_price * (1 + tp_ratio)
         elif action == "sell":
-            stop_loss = current_price * (1 + sl_percent / 100)
-            take_profit = current_price * (1 - tp_percent / 100)
+            stop_loss = current_price * (1 + sl_ratio)
+            take_profit = current_price * (1 - tp_ratio)
         else:
             stop_loss = current_price
             take_profit = current_price
@@ -161,7 +288,10 @@ class DynamicRiskManager:
         if not hasattr(cls, '_global_instance'):
             cls._global_instance = cls()
         
-        cls._global_instance.update_global_risk(stop_loss_percent, take_profit_percent)
+        # Coalesced with any other updates made in quick succession
+        cls._global_instance.queue_update({
+            "global": {"stop_loss": stop_loss_percent, "take_profit": take_profit_percent}
+        })
     
     @classmethod
     def update_strategy_risk_settings(cls,
@@ -175,7 +305,36 @@ class DynamicRiskManager:
         if not hasattr(cls, '_global_instance'):
             cls._global_instance = cls()
         
-        cls._global_instance.update_strategy_risk(strategy_name, stop_loss_percent, take_profit_percent)
+        # Coalesced with any other updates made in quick succession
+        cls._global_instance.queue_update({
+            "strategies": {
+                strategy_name: {"stop_loss": stop_loss_percent, "take_profit": take_profit_percent}
+            }
+        })
+    
+    @classmethod
+    def bulk_update_settings(cls, payload: Dict[str, Any]) -> bool:
+        """
+        Class method to apply several risk changes at once
+        Can be called from Colab cells
+        """
+        if not hasattr(cls, '_global_instance'):
+            cls._global_instance = cls()
+        
+        # Applied right away, together with anything still pending
+        cls._global_instance.queue_update(payload)
+        return cls._global_instance.flush()
+    
+    @classmethod
+    def flush_pending_settings(cls) -> bool:
+        """
+        Class method to apply any queued risk updates immediately
+        Can be called from Colab cells
+        """
+        if not hasattr(cls, '_global_instance'):
+            cls._global_instance = cls()
+        
+        return cls._global_instance.flush()
     
     @classmethod
     def get_current_risk_settings(cls) -> Dict[str, Any]:
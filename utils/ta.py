@@ -3,6 +3,8 @@
 import pandas as pd
 import numpy as np
 
+from ._njit import njit, NUMBA_AVAILABLE
+
 class TechnicalAnalysis:
     @staticmethod
     def calculate_rsi(series: pd.Series, period: int) -> pd.Series:
@@ -20,7 +22,7 @@ class TechnicalAnalysis:
 
     @staticmethod
     def fast_ema(series: pd.Series, period: int) -> pd.Series:
-        return series.ewm(span=period, adjust=False).mean()
+        return pd.Series(ema_array(series.values, period), index=series.index)
 
     @staticmethod
     def calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Series:
@@ -29,4 +31,422 @@ class TechnicalAnalysis:
         tr2 = abs(high - prev_close)
         tr3 = abs(low - prev_close)
         tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        return tr.rolling(window=period).mean()
\ No newline at end of file
+        return tr.rolling(window=period).mean()
+
+def ewm_alpha(span: int) -> float:
+    """Smoothing factor pandas uses for ewm(span=span)"""
+    return 1.0 / (1.0 + (span - 1) / 2.0)
+
+
+def last_or(values: np.ndarray, default: float) -> float:
+    """Last value as a float, or default when it is NaN"""
+    value = float(values[-1])
+    return default if value != value else value
+
+
+def tail_mean(values: np.ndarray, window: int) -> float:
+    """Last value of rolling(window).mean(), or the last value if too short"""
+    if len(values) >= window:
+        return float(values[-window:].sum()) / window
+    return float(values[-1])
+
+
+class EmaState:
+    """Running ewm(span, adjust=False) mean, advanced one value at a time
+
+    Uses the same arithmetic as pandas so the last value matches
+    series.ewm(span=span, adjust=False).mean().iloc[-1] exactly, NaN
+    included: a NaN repeats the last value and only ages its weight.
+    """
+    __slots__ = ("alpha", "decay", "weight", "value")
+
+    def __init__(self, span: int):
+        self.alpha = ewm_alpha(span)
+        self.decay = 1.0 - self.alpha
+        self.weight = 1.0
+        self.value = float('nan')
+
+    def update(self, x: float) -> float:
+        value = self.value
+        if value != value:  # First observation seeds the average
+            self.value = x
+            return x
+        self.weight *= self.decay
+        if x == x:
+            if value != x:
+                weight = self.weight
+                # pandas tops the new weight up to 1 when com == 1 (span 3)
+                new_weight = 1.0 - weight if self.alpha == 0.5 else self.alpha
+                self.value = (weight * value + new_weight * x) / (weight + new_weight)
+            self.weight = 1.0
+        return self.value
+
+
+class RsiState:
+    """Running RSI with Wilder's smoothing (RMA, alpha = 1/period)
+
+    The first `period` price changes are averaged to seed the gain/loss
+    averages, then each step is avg += (x - avg) / period. RSI is 50
+    until the seed exists, matching the fill used for undefined values.
+    """
+    __slots__ = ("period", "changes", "avg_gain", "avg_loss", "prev_close", "value")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.changes = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.prev_close = None
+        self.value = 50.0
+
+    def update(self, close: float) -> float:
+        prev_close = self.prev_close
+        self.prev_close = close
+        if prev_close is None:
+            return self.value
+        delta = close - prev_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        period = self.period
+        self.changes += 1
+        if self.changes < period:
+            # Warm-up: running sums, averaged once `period` changes are in
+            self.avg_gain += gain
+            self.avg_loss += loss
+            return self.value
+        if self.changes == period:
+            self.avg_gain = (self.avg_gain + gain) / period
+            self.avg_loss = (self.avg_loss + loss) / period
+        else:
+            self.avg_gain += (gain - self.avg_gain) / period
+            self.avg_loss += (loss - self.avg_loss) / period
+        if self.avg_loss:
+            self.value = 100 - (100 / (1 + self.avg_gain / self.avg_loss))
+        else:
+            # Flat window is undefined (filled with 50), all gains saturate at 100
+            self.value = 100.0 if self.avg_gain else 50.0
+        return self.value
+
+
+class MacdState:
+    """Running MACD line and signal line"""
+    __slots__ = ("fast", "slow", "signal", "macd")
+
+    def __init__(self, fast: int, slow: int, signal: int):
+        self.fast = EmaState(fast)
+        self.slow = EmaState(slow)
+        self.signal = EmaState(signal)
+        self.macd = 0.0
+
+    def update(self, close: float) -> float:
+        self.macd = self.fast.update(close) - self.slow.update(close)
+        self.signal.update(self.macd)
+        return self.macd
+
+
+
+@njit(cache=True)
+def _ema_into(values, alpha, out):
+    """EmaState.update() over values, written into out"""
+    decay = 1.0 - alpha
+    weight = 1.0
+    value = np.nan
+    for i in range(len(values)):
+        x = values[i]
+        if value != value:
+            value = x
+        else:
+            weight *= decay
+            if x == x:
+                if value != x:
+                    new_weight = 1.0 - weight if alpha == 0.5 else alpha
+                    value = (weight * value + new_weight * x) / (weight + new_weight)
+                weight = 1.0
+        out[i] = value
+    return out
+
+
+@njit(cache=True)
+def _rsi_into(values, period, out):
+    """RsiState.update() over values, written into out"""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    rsi = 50.0
+    for i in range(len(values)):
+        if i:
+            delta = values[i] - values[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if i < period:
+                avg_gain += gain
+                avg_loss += loss
+            else:
+                if i == period:
+                    avg_gain = (avg_gain + gain) / period
+                    avg_loss = (avg_loss + loss) / period
+                else:
+                    avg_gain += (gain - avg_gain) / period
+                    avg_loss += (loss - avg_loss) / period
+                if avg_loss:
+                    rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+                else:
+                    rsi = 100.0 if avg_gain else 50.0
+        out[i] = rsi
+    return out
+
+
+def ema_array(values: np.ndarray, span: int) -> np.ndarray:
+    """ewm(span, adjust=False).mean() over a float array"""
+    values = np.asarray(values, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _ema_into(values, ewm_alpha(span), np.empty(len(values)))
+    # Without numba a loop over plain floats beats indexing the ndarray
+    state = EmaState(span)
+    return np.array([state.update(x) for x in values.tolist()])
+
+
+def rsi_array(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder RSI over a float array, 50 where it is undefined"""
+    values = np.asarray(values, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _rsi_into(values, period, np.empty(len(values)))
+    state = RsiState(period)
+    return np.array([state.update(x) for x in values.tolist()])
+
+
+def macd_arrays(values: np.ndarray, fast: int, slow: int, signal: int) -> tuple:
+    """(macd, signal, histogram) arrays"""
+    macd = ema_array(values, fast) - ema_array(values, slow)
+    macd_signal = ema_array(macd, signal)
+    return macd, macd_signal, macd - macd_signal
+
+
+def sma_array(values: np.ndarray, period: int) -> np.ndarray:
+    """rolling(period, min_periods=1).mean() over a float array"""
+    values = np.asarray(values, dtype=np.float64)
+    sums = np.cumsum(values)
+    sums[period:] = sums[period:] - sums[:-period]
+    return sums / np.minimum(np.arange(1, len(values) + 1), period)
+
+@njit(cache=True)
+def _ewm_update(value, x, alpha):
+    """One ewm(adjust=False) step, same arithmetic as EmaState.update()"""
+    if value != x:
+        decay = 1.0 - alpha
+        return (decay * value + alpha * x) / (decay + alpha)
+    return value
+
+
+@njit(cache=True)
+def fast_scalp_core(close, rsi_period, a_fast, a_slow, a_signal, a_ema_fast, a_ema_slow):
+    """Fast-Scalp indicators in one pass over the closes
+
+    EMAs take their smoothing factors precomputed with ewm_alpha(span).
+    Returns (rsi, prev_rsi, macd, macd_signal, ema_fast, ema_slow) for the
+    last bar; prev_rsi is the RSI one bar earlier (50 for a single bar).
+    Values match RsiState/MacdState/EmaState exactly.
+    """
+    first = close[0]
+    avg_gain = 0.0
+    avg_loss = 0.0
+    fast = first
+    slow = first
+    macd = 0.0
+    signal = 0.0
+    ema_fast = first
+    ema_slow = first
+    rsi = 50.0
+    prev_rsi = 50.0
+    prev_close = first
+
+    for i in range(len(close)):
+        price = close[i]
+        if i:
+            delta = price - prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            # Wilder smoothing, seeded with the mean of the first rsi_period changes
+            if i < rsi_period:
+                avg_gain += gain
+                avg_loss += loss
+            elif i == rsi_period:
+                avg_gain = (avg_gain + gain) / rsi_period
+                avg_loss = (avg_loss + loss) / rsi_period
+            else:
+                avg_gain += (gain - avg_gain) / rsi_period
+                avg_loss += (loss - avg_loss) / rsi_period
+            fast = _ewm_update(fast, price, a_fast)
+            slow = _ewm_update(slow, price, a_slow)
+            macd = fast - slow
+            signal = _ewm_update(signal, macd, a_signal)
+            ema_fast = _ewm_update(ema_fast, price, a_ema_fast)
+            ema_slow = _ewm_update(ema_slow, price, a_ema_slow)
+        prev_close = price
+
+        prev_rsi = rsi
+        if i < rsi_period:
+            rsi = 50.0
+        elif avg_loss:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        else:
+            rsi = 100.0 if avg_gain else 50.0
+
+    return rsi, prev_rsi, macd, signal, ema_fast, ema_slow
+
+
+def _ewm_update_2d(value: np.ndarray, x: np.ndarray, alpha: float) -> np.ndarray:
+    """_ewm_update() applied elementwise across a column of symbols"""
+    decay = 1.0 - alpha
+    return np.where(value != x, (decay * value + alpha * x) / (decay + alpha), value)
+
+
+@njit(cache=True)
+def _fast_scalp_core_rows(closes, rsi_period, a_fast, a_slow, a_signal, a_ema_fast, a_ema_slow):
+    """fast_scalp_core() per row, compiled as one loop; (6, symbols) result"""
+    out = np.empty((6, closes.shape[0]))
+    for row in range(closes.shape[0]):
+        values = fast_scalp_core(closes[row], rsi_period, a_fast, a_slow, a_signal, a_ema_fast, a_ema_slow)
+        for k in range(6):
+            out[k, row] = values[k]
+    return out
+
+
+def fast_scalp_core_2d(closes, rsi_period, a_fast, a_slow, a_signal, a_ema_fast, a_ema_slow):
+    """fast_scalp_core() over a (symbols, bars) array, vectorised across symbols
+
+    Returns the same six values as arrays with one entry per symbol (row).
+    With numba the rows go through one compiled call; without it each bar
+    is a numpy step across all symbols.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return tuple(_fast_scalp_core_rows(closes, rsi_period, a_fast, a_slow, a_signal, a_ema_fast, a_ema_slow))
+
+    first = closes[:, 0]
+    avg_gain = np.zeros(len(closes))
+    avg_loss = np.zeros(len(closes))
+    fast = first
+    slow = first
+    macd = np.zeros(len(closes))
+    signal = macd
+    ema_fast = first
+    ema_slow = first
+    rsi = np.full(len(closes), 50.0)
+    prev_rsi = rsi
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i in range(closes.shape[1]):
+            price = closes[:, i]
+            if i:
+                delta = price - closes[:, i - 1]
+                # fmax rather than maximum: a NaN change counts as 0, like the scalar kernel
+                gain = np.fmax(delta, 0.0)
+                loss = np.fmax(-delta, 0.0)
+                if i < rsi_period:
+                    avg_gain = avg_gain + gain
+                    avg_loss = avg_loss + loss
+                elif i == rsi_period:
+                    avg_gain = (avg_gain + gain) / rsi_period
+                    avg_loss = (avg_loss + loss) / rsi_period
+                else:
+                    avg_gain = avg_gain + (gain - avg_gain) / rsi_period
+                    avg_loss = avg_loss + (loss - avg_loss) / rsi_period
+                fast = _ewm_update_2d(fast, price, a_fast)
+                slow = _ewm_update_2d(slow, price, a_slow)
+                macd = fast - slow
+                signal = _ewm_update_2d(signal, macd, a_signal)
+                ema_fast = _ewm_update_2d(ema_fast, price, a_ema_fast)
+                ema_slow = _ewm_update_2d(ema_slow, price, a_ema_slow)
+
+            prev_rsi = rsi
+            if i < rsi_period:
+                continue
+            rsi = np.where(
+                avg_loss != 0,
+                100 - (100 / (1 + avg_gain / avg_loss)),
+                np.where(avg_gain != 0, 100.0, 50.0)
+            )
+
+    return rsi, prev_rsi, macd, signal, ema_fast, ema_slow
+
+
+@njit(cache=True)
+def gcp_growth_scan(prices, min_growth, consistency_threshold, max_window):
+    """Best growth/decline window ending at the last price, in one pass
+
+    Windows of 5..max_window bars are grown one change at a time from the
+    end, keeping running rising/falling counts and the net change. Returns
+    (total_growth, score, window_size); window_size is 0 when none qualifies.
+    """
+    n = len(prices)
+    last = prices[n - 1]
+    rising = 0
+    falling = 0
+    net = 0.0
+    best_growth = 0.0
+    best_abs = 0.0
+    best_score = 0.0
+    best_window = 0
+    for k in range(1, min(n, max_window)):
+        change = prices[n - k] - prices[n - k - 1]
+        if change > 0:
+            rising += 1
+        elif change < 0:
+            falling += 1
+        net += change
+        window = k + 1
+        if window < 5:
+            continue
+        # Consistency in the net direction, scored symmetrically
+        consistency = rising / k if net > 0 else falling / k
+        score = consistency if consistency > 1 - consistency else 1 - consistency
+        start = prices[n - window]
+        growth = (last - start) / start * 100
+        size = abs(growth)
+        if size >= min_growth and score >= consistency_threshold and size > best_abs:
+            best_growth = growth
+            best_abs = size
+            best_score = score
+            best_window = window
+    return best_growth, best_score, best_window
+
+
+@njit(cache=True)
+def gcp_plateau_scan(prices, volatility_threshold, drift_threshold, min_duration, max_window):
+    """Best plateau window ending at the last price
+
+    Each 4..max_window bar window is scored on volatility (std / mean) and
+    drift (least-squares slope as % of mean per bar), weighted 0.6 / 0.4.
+    Returns (score, window_size); window_size is 0 when none scores >= 0.25.
+    """
+    n = len(prices)
+    best_score = 0.0
+    best_window = 0
+    for window in range(4, min(n, max_window) + 1):
+        start = n - window
+        total = 0.0
+        for i in range(start, n):
+            total += prices[i]
+        mean = total / window
+        if mean == 0:
+            continue
+        x_mean = (window - 1) / 2.0
+        squares = 0.0
+        cross = 0.0
+        for i in range(start, n):
+            deviation = prices[i] - mean
+            squares += deviation * deviation
+            cross += (i - start - x_mean) * deviation
+        # Closed-form slope; sum((x - x_mean)^2) over 0..window-1
+        slope = cross / (window * (window * window - 1) / 12.0)
+        volatility = (squares / window) ** 0.5 / mean
+        drift = slope / mean * 100
+        volatility_score = 1 - volatility / volatility_threshold
+        volatility_score = volatility_score if volatility_score > 0 else 0.0
+        drift_score = 1 - abs(drift) / drift_threshold
+        drift_score = drift_score if drift_score > 0 else 0.0
+        score = (volatility_score * 0.6) + (drift_score * 0.4)
+        if score >= 0.25 and window >= min_duration and score > best_score:
+            best_score = score
+            best_window = window
+    return best_score, best_window
@@ -12,20 +12,15 @@ class TelegramNotifier:
     """Telegram bot using centralized parameters from config"""
 
     def __init__(self):
-        from cryptobot.config import BotConfig
+        from cryptobot.config import BotConfig, get_credentials
         
-        # Load token/chat_id directly from config
-        self.bot_token = BotConfig.TELEGRAM_BOT_TOKEN.strip()
-        self.chat_id = BotConfig.TELEGRAM_CHAT_ID.strip()
+        # Load token/chat_id from the process-wide credential cache
+        credentials = get_credentials()
+        self.bot_token = credentials["TELEGRAM_BOT_TOKEN"].strip()
+        self.chat_id = credentials["TELEGRAM_CHAT_ID"].strip()
         
-        # Validate credentials
-        self.enabled = (
-            self.bot_token and self.chat_id and 
-            self.bot_token != "your_telegram_token_here" and 
-            self.chat_id != "your_chat_id" and
-            not self.bot_token.startswith("YOUR_") and
-            not self.chat_id.startswith("YOUR_")
-        )
+        # Credentials (and TELEGRAM_ENABLED) are checked once at config load
+        self.enabled = BotConfig.EFFECTIVE_TELEGRAM_ENABLED
 
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
 